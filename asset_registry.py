@@ -0,0 +1,90 @@
+from threading import RLock
+import time
+from typing import Any, Callable
+import pygame
+
+
+class AssetRegistry:
+    """
+    Loads every asset on its first use instead of on import, and keeps it.
+    The assets that were not needed yet can be preloaded in the background.
+    load_times holds how long every load took, for --profile-startup.
+
+    An asset can have a convert step, like converting an image to the display format.
+    It runs after loading once a display exists, and convert_loaded runs it for the
+    assets that were loaded before.
+    """
+
+    _loaders: dict[str, Callable[[], Any]] = {}
+    _converters: dict[str, Callable[[Any], Any]] = {}
+    _assets: dict[str, Any] = {}
+    _converted: set[str] = set()
+    _lock = RLock()
+    load_times: dict[str, float] = {}
+
+    @classmethod
+    def register(
+        cls,
+        name: str,
+        loader: Callable[[], Any],
+        convert: Callable[[Any], Any] | None = None,
+    ) -> None:
+        cls._loaders[name] = loader
+        if convert is not None:
+            cls._converters[name] = convert
+
+    @classmethod
+    def get(cls, name: str) -> Any:
+        if name in cls._assets:
+            return cls._assets[name]
+
+        with cls._lock:
+            # another thread may have loaded it while this one waited
+            if name not in cls._assets:
+                start = time.perf_counter()
+                cls._assets[name] = cls._loaders[name]()
+                cls._convert(name)
+                cls.load_times[name] = time.perf_counter() - start
+            return cls._assets[name]
+
+    @classmethod
+    def load(
+        cls,
+        name: str,
+        loader: Callable[[], Any],
+        convert: Callable[[Any], Any] | None = None,
+    ) -> Any:
+        """
+        Registers the loader if the asset is unknown, and returns the asset.
+        """
+        if name not in cls._loaders:
+            cls.register(name, loader, convert)
+        return cls.get(name)
+
+    @classmethod
+    def convert_loaded(cls) -> None:
+        """
+        Called once the display exists. The assets are converted in the order they
+        were registered, so the atlas is converted before the images cut from it.
+        """
+        with cls._lock:
+            for name in list(cls._loaders):
+                if name in cls._assets:
+                    cls._convert(name)
+
+    @classmethod
+    def _convert(cls, name: str) -> None:
+        convert = cls._converters.get(name)
+        if (
+            convert is None
+            or name in cls._converted
+            or pygame.display.get_surface() is None
+        ):
+            return
+        cls._assets[name] = convert(cls._assets[name])
+        cls._converted.add(name)
+
+    @classmethod
+    def preload(cls) -> None:
+        for name in list(cls._loaders):
+            cls.get(name)
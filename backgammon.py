@@ -1,7 +1,9 @@
+import itertools
 import random
 from threading import Thread
 import time
-from decorators import run_threaded
+from concurrent.futures import Future
+from decorators import run_in_pool
 from models import GameState, MoveType, OnlineGameState, ScoredMoves
 from models import Player
 import copy
@@ -10,15 +12,26 @@ from typing import Callable
 
 type Dice = tuple[int, int]
 
+# Shared by every game so a version is never reused, even across instances.
+_versions = itertools.count(1)
+
 
 class Backgammon:
     _history: list[GameState]
+    version: int
 
     def __init__(self, state_list: list[GameState] | None = None) -> None:
         if state_list is None:
             self.new_game()
         else:
             self._history = state_list
+            self._touch()
+
+    def _touch(self) -> None:
+        """
+        Marks the game as changed. Called after every mutation of the history.
+        """
+        self.version = next(_versions)
     
     def deepcopy(self):
         bg = Backgammon(state_list=[state.model_copy() for state in self._history])
@@ -56,6 +69,7 @@ class Backgammon:
             score=score,
         )
         self._history = [new_state]
+        self._touch()
 
     def create_board(self) -> None:
         # Initialize board with pieces in starting positions
@@ -129,10 +143,12 @@ class Backgammon:
 
     def save_state(self, state: GameState) -> None:
         self._history.append(state)
+        self._touch()
 
     def undo(self):
         if len(self._history) > 1:
             self._history.pop()
+            self._touch()
             return True
         return False
 
@@ -234,6 +250,7 @@ class Backgammon:
         state.current_turn = (Player.other(self.current_turn))
         state.dice = self.roll_dice()
         state.moves_left = self.get_moves_from_dice(self.state.dice)
+        self._touch()
 
     def is_bearing_off(self) -> bool:
         home_range = self.get_home_range(self.current_turn)
@@ -395,16 +412,43 @@ class OnlineBackgammon:
     game: Backgammon
     started: bool
     is_player2_connected: bool
-    local_color: Color
-    online_color: Color
 
     def __init__(self, online_color: Color, local_color: Color) -> None:
         self.game = Backgammon()
         self.time_on_switch_turn = 0
         self.is_player2_connected = False
-        self.online_color = online_color
-        self.local_color = local_color
-    
+        self._online_color = online_color
+        self._local_color = local_color
+        self._colors_version = next(_versions)
+        self._mirrored_state: tuple[int, OnlineGameState | None] = (-1, None)
+
+    @property
+    def online_color(self) -> Color:
+        return self._online_color
+
+    @online_color.setter
+    def online_color(self, color: Color):
+        if color != self._online_color:
+            self._online_color = color
+            self._colors_version = next(_versions)
+
+    @property
+    def local_color(self) -> Color:
+        return self._local_color
+
+    @local_color.setter
+    def local_color(self, color: Color):
+        if color != self._local_color:
+            self._local_color = color
+            self._colors_version = next(_versions)
+
+    @property
+    def version(self) -> int:
+        """
+        Changes whenever the game or one of the player colors changes.
+        """
+        return max(self.game.version, self._colors_version)
+
     def new_game(self) -> None:
         self.game.new_game(winner=self.game.winner)
 
@@ -445,6 +489,17 @@ class OnlineBackgammon:
 
         return self.get_online_game_state(state)
 
+    def get_mirrored_state(self) -> OnlineGameState:
+        """
+        Same as manipulate_board, but computed once per version.
+        The returned state is shared between callers and must not be modified.
+        """
+        version, state = self._mirrored_state
+        if version != self.version:
+            state = self.manipulate_board()
+            self._mirrored_state = (self.version, state)
+        return state
+
     def manipulate_move(self, move: Move) -> Move:
         board_length = len(self.game.board)
         return Move(
@@ -637,13 +692,14 @@ class BackgammonAI:
     @classmethod
     def get_best_move(
         cls, game: Backgammon, callback: Callable[[ScoredMoves], None] = lambda x: None
-    ) -> None:
+    ) -> Future[ScoredMoves]:
 
         game_copy = game.deepcopy()
 
-        @run_threaded(daemon=True)
+        @run_in_pool
         def get_move():
             moves = cls._threaded_get_best_move(game_copy)
             callback(moves)
+            return moves
 
-        get_move()
+        return get_move()
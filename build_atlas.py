@@ -0,0 +1,50 @@
+"""
+Builds the texture atlas of the UI images.
+
+Packs every image in config.IMAGES, at the size it is used in, into
+assets/images/atlas.png and writes the rect of each image to assets/images/atlas.json.
+Run it again after changing the images or their sizes. Images whose size no longer
+matches the atlas are loaded from their own files until then.
+
+    python build_atlas.py
+"""
+
+import argparse
+import json
+import os
+
+import pygame
+
+import config
+from graphics.texture_atlas import pack
+
+# large opaque images gain nothing from sharing a surface with the icons
+EXCLUDED = {"BACKGROUND"}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.parse_args()
+
+    images = {
+        name: config.load_file_image(file_name, size)
+        for name, (file_name, size) in config.IMAGES.items()
+        if name not in EXCLUDED
+    }
+    atlas = pack(images)
+
+    pygame.image.save(atlas.surface, config.ATLAS_IMAGE_PATH)
+    with open(config.ATLAS_INDEX_PATH, "w") as index_file:
+        json.dump(
+            {name: list(rect) for name, rect in atlas.index.items()},
+            index_file,
+            indent=4,
+        )
+    print(
+        f"packed {len(images)} images into {os.path.relpath(config.ATLAS_IMAGE_PATH)}"
+        f" ({atlas.surface.get_width()}x{atlas.surface.get_height()})"
+    )
+
+
+if __name__ == "__main__":
+    main()
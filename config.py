@@ -1,8 +1,12 @@
+import functools
 import math
 from typing import Literal
 import pygame
 from asset import asset
+from asset_registry import AssetRegistry
 import os
+from font_manager import FontManager
+from graphics.texture_atlas import TextureAtlas
 
 from models import GameSound
 
@@ -10,28 +14,126 @@ DEFAULT_PLAYER1_COLOR = pygame.Color(100, 100, 100)
 DEFAULT_PLAYER2_COLOR = pygame.Color(150, 100, 100)
 NETWORK_BUFFER = 2048 * 2
 GAME_PORT = 6324
+SESSION_GRACE_PERIOD = 60
+# set to serve the host's server metrics on http://127.0.0.1:METRICS_PORT/metrics
+METRICS_PORT: int | None = None
+METRICS_LOG_INTERVAL: float | None = None
+# the window size, updated by set_resolution when the window is resized
 RESOLUTION: tuple[int, int] = (1280, 720)
 SCREEN = pygame.Rect(0, 0, 1280, 720)
+MIN_RESOLUTION: tuple[int, int] = (1280, 720)
+# menus are laid out in a MENU sized area that is kept in the middle of the window
+MENU = pygame.Rect(0, 0, 1280, 720)
 FRAMERATE: int = 60
+# frames per second while nothing changes on the screen
+IDLE_FRAMERATE: float = 4
+# threads shared by background jobs such as bot searches
+WORKER_THREADS: int = 2
 BUTTON_COLOR = pygame.Color(200, 0, 0)
 BUTTON_HOVER_COLOR = pygame.Color(250, 250, 250)
-BACKGROUND = pygame.transform.scale(
-    pygame.image.load(asset(os.path.join("assets", "images", "background.jpg"))),
-    (1280, 720),
-)
-OPTIONS_ICON = pygame.transform.scale(
-    pygame.image.load(asset(os.path.join("assets", "images", "settings.png"))), (60, 60)
-)
-GAME_ICON = pygame.transform.scale(
-    pygame.image.load(asset(os.path.join("assets", "images", "backgammon.png"))),
-    (60, 60),
-)
-VOLUME_ICON = pygame.transform.scale(
-    pygame.image.load(asset(os.path.join("assets", "images", "volume.png"))), (60, 60)
-)
-MUTE_ICON = pygame.transform.scale(
-    pygame.image.load(asset(os.path.join("assets", "images", "mute.png"))), (60, 60)
+
+# loaded on first use, through the module __getattr__ below
+IMAGES: dict[str, tuple[str, tuple[int, int]]] = {
+    "BACKGROUND": ("background.jpg", (1280, 720)),
+    "OPTIONS_ICON": ("settings.png", (60, 60)),
+    "GAME_ICON": ("backgammon.png", (60, 60)),
+    "VOLUME_ICON": ("volume.png", (60, 60)),
+    "MUTE_ICON": ("mute.png", (60, 60)),
+}
+
+
+# built by build_atlas.py, images missing from it are loaded from their own files
+ATLAS_IMAGE_PATH = asset(os.path.join("assets", "images", "atlas.png"))
+ATLAS_INDEX_PATH = asset(os.path.join("assets", "images", "atlas.json"))
+
+
+def load_atlas() -> TextureAtlas | None:
+    if not (os.path.isfile(ATLAS_IMAGE_PATH) and os.path.isfile(ATLAS_INDEX_PATH)):
+        return None
+    return TextureAtlas.load(ATLAS_IMAGE_PATH, ATLAS_INDEX_PATH)
+
+
+def load_file_image(file_name: str, size: tuple[int, int]) -> pygame.Surface:
+    return pygame.transform.scale(
+        pygame.image.load(asset(os.path.join("assets", "images", file_name))), size
+    )
+
+
+def load_image(name: str) -> pygame.Surface:
+    file_name, size = IMAGES[name]
+    atlas: TextureAtlas | None = AssetRegistry.get("ATLAS")
+    if atlas is not None and atlas.get_size(name) == size:
+        return atlas.get(name)
+    return load_file_image(file_name, size)
+
+
+def convert_image(image: pygame.Surface) -> pygame.Surface:
+    """
+    Converts to the display format, so blitting the image needs no conversion.
+    """
+    if image.get_flags() & pygame.SRCALPHA:
+        return image.convert_alpha()
+    return image.convert()
+
+
+def convert_loaded_image(name: str, image: pygame.Surface) -> pygame.Surface:
+    """
+    Converts an image from IMAGES. An image from the atlas is a subsurface that
+    may have been cut before the atlas was converted, so it is cut again from
+    the converted atlas.
+    """
+    if image.get_parent() is not None:
+        return load_image(name)
+    return convert_image(image)
+
+
+def render_image(name: str, size: tuple[int, int]) -> pygame.Surface:
+    """
+    Rasterizes an image from IMAGES at any size from its full resolution file,
+    for images that follow the window size. The file is decoded once.
+    """
+    if size == IMAGES[name][1]:
+        return AssetRegistry.get(name)
+    file_name, _ = IMAGES[name]
+    source = AssetRegistry.load(
+        f"{name} source",
+        lambda: pygame.image.load(asset(os.path.join("assets", "images", file_name))),
+    )
+    image = pygame.transform.scale(source, size)
+    if pygame.display.get_surface() is not None:
+        image = convert_image(image)
+    return image
+
+
+def get_image(name: str, size: tuple[int, int] | None = None) -> pygame.Surface:
+    """
+    Returns an image from IMAGES. Scaled images are kept like the originals.
+    """
+    if size is None:
+        return AssetRegistry.get(name)
+    return AssetRegistry.load(
+        f"{name} {size[0]}x{size[1]}",
+        lambda: pygame.transform.scale(AssetRegistry.get(name), size),
+        convert=convert_image,
+    )
+
+
+AssetRegistry.register(
+    "ATLAS", load_atlas, convert=lambda atlas: atlas and atlas.convert_alpha()
 )
+for name in IMAGES:
+    AssetRegistry.register(
+        name,
+        functools.partial(load_image, name),
+        convert=functools.partial(convert_loaded_image, name),
+    )
+
+
+def __getattr__(name: str):
+    if name in IMAGES:
+        return AssetRegistry.get(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 type x = dict[Literal["button"], str]
 
@@ -42,5 +144,14 @@ TIMER_SOUND = GameSound(key="timer", path=asset(os.path.join("assets", "sounds",
 
 TIMER = 20
 
+def set_resolution(size: tuple[int, int]) -> None:
+    """
+    Sizes under MIN_RESOLUTION are raised to it, so the menus always fit.
+    """
+    global RESOLUTION
+    RESOLUTION = (max(size[0], MIN_RESOLUTION[0]), max(size[1], MIN_RESOLUTION[1]))
+    SCREEN.size = RESOLUTION
+
+
 def get_font(size: int, bold=False, italic=False) -> pygame.font.Font:
-    return pygame.font.SysFont("Cooper Black", size, bold, italic)
\ No newline at end of file
+    return FontManager.get_font(size, bold, italic)
\ No newline at end of file
@@ -1,27 +1,33 @@
+from concurrent.futures import Future
 import functools
-from threading import Timer, Thread
+from threading import Thread
 from time import sleep
 import time
 from typing import Any, Callable
 
+from frame_scheduler import ScheduledCallback
 from game_manager import GameManager
+from worker_pool import WorkerPool
 
 
 def debounce(timeout: float):
     """
     Decorator that will debounce a function. The function will be executed after timeout seconds
     if there will be no additional calls during the timeout period.
+    It runs on the main thread, from the frame scheduler of the game loop.
     """
 
     def decorator(func):
-        timer = Timer(timeout, lambda: None)
-        
+        scheduled: ScheduledCallback | None = None
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            nonlocal timer
-            timer.cancel()
-            timer = Timer(timeout, func, args, kwargs)
-            timer.start()
+            nonlocal scheduled
+            if scheduled is not None:
+                scheduled.cancel()
+            scheduled = GameManager.frame_scheduler.call_later(
+                timeout, functools.partial(func, *args, **kwargs)
+            )
 
         return wrapper
 
@@ -81,6 +87,18 @@ def run_threaded(daemon=False):
 
     return decorator
 
+
+def run_in_pool(func: Callable[..., Any]):
+    """
+    Decorator that will run the function on the shared WorkerPool. The function will return a Future.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs) -> Future:
+        return WorkerPool.submit(func, *args, **kwargs)
+
+    return wrapper
+
         
 # @debounce(2)
 # def idk(h: str):
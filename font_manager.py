@@ -0,0 +1,51 @@
+import os
+import pygame
+from asset import asset
+from asset_registry import AssetRegistry
+
+
+class FontManager:
+    """
+    Loads each font once per size and style and shares it between all callers.
+    A bundled TTF in assets/fonts is preferred, otherwise the system font list
+    is searched once, on the first request.
+    """
+
+    NAME = "Cooper Black"
+    BUNDLED_PATH = asset(os.path.join("assets", "fonts", "CooperBlack.ttf"))
+
+    _path: str | None = None
+    _resolved = False
+    _fonts: dict[tuple[int, bool, bool], pygame.font.Font] = {}
+
+    @classmethod
+    def get_path(cls) -> str | None:
+        """
+        Returns the font file, or None for pygame's default font.
+        """
+        if not cls._resolved:
+            if os.path.isfile(cls.BUNDLED_PATH):
+                cls._path = cls.BUNDLED_PATH
+            else:
+                cls._path = pygame.font.match_font(cls.NAME)
+            cls._resolved = True
+        return cls._path
+
+    @classmethod
+    def get_font(cls, size: int, bold=False, italic=False) -> pygame.font.Font:
+        key = (size, bold, italic)
+        font = cls._fonts.get(key)
+        if font is None:
+            font = AssetRegistry.load(
+                f"font {size}{' bold' if bold else ''}{' italic' if italic else ''}",
+                lambda: cls._load_font(size, bold, italic),
+            )
+            cls._fonts[key] = font
+        return font
+
+    @classmethod
+    def _load_font(cls, size: int, bold: bool, italic: bool) -> pygame.font.Font:
+        font = pygame.font.Font(cls.get_path(), size)
+        font.set_bold(bold)
+        font.set_italic(italic)
+        return font
@@ -0,0 +1,143 @@
+import heapq
+import itertools
+import threading
+import time
+from typing import Callable
+import pygame
+from input_snapshot import InputSnapshot
+
+
+class ScheduledCallback:
+    def __init__(self, deadline: float, callback: Callable[[], None]) -> None:
+        self.deadline = deadline
+        self.callback = callback
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+
+class FrameScheduler:
+    """
+    Paces the main loops. Frames run at the full framerate while input events arrive.
+    After ACTIVE_PERIOD seconds without any, the loop blocks on pygame.event.wait and
+    renders at most idle_framerate frames per second. Changes that do not come from
+    events end the wait early through wake deadlines and wake().
+    Delayed callbacks are kept in a heap and run on the main thread by tick().
+    Window resizes are passed to on_resize when the events are read.
+    """
+
+    WAKE_EVENT = pygame.event.custom_type()
+    ACTIVE_PERIOD = 0.5
+
+    def __init__(
+        self,
+        clock: pygame.time.Clock,
+        framerate: int,
+        idle_framerate: float,
+        on_resize: Callable[[tuple[int, int]], None] = lambda size: None,
+    ) -> None:
+        self._clock = clock
+        self._on_resize = on_resize
+        self._framerate = framerate
+        self._idle_timeout = 1 / idle_framerate
+        self._pending_events: list[pygame.event.Event] = []
+        self._last_active = time.time()
+        self._deadline: float | None = None
+        self._callbacks: list[tuple[float, int, ScheduledCallback]] = []
+        self._callbacks_lock = threading.Lock()
+        self._sequence = itertools.count()
+
+    @property
+    def idle(self) -> bool:
+        return time.time() - self._last_active > self.ACTIVE_PERIOD
+
+    def mark_active(self) -> None:
+        """
+        Keeps the full framerate for another ACTIVE_PERIOD seconds.
+        """
+        self._last_active = time.time()
+
+    def wake_at(self, deadline: float) -> None:
+        """
+        Makes sure the next frame is rendered no later than deadline (in time.time()).
+        Deadlines only apply to the next frame, so they should be set every frame.
+        """
+        if self._deadline is None or deadline < self._deadline:
+            self._deadline = deadline
+
+    @classmethod
+    def wake(cls) -> None:
+        """
+        Ends the current idle wait. Safe to call from any thread.
+        """
+        try:
+            pygame.event.post(pygame.event.Event(cls.WAKE_EVENT))
+        except pygame.error:
+            pass
+
+    def call_later(
+        self, delay: float, callback: Callable[[], None]
+    ) -> ScheduledCallback:
+        """
+        Runs callback on the main thread, at the start of the first frame after delay seconds.
+        """
+        scheduled = ScheduledCallback(deadline=time.time() + delay, callback=callback)
+        with self._callbacks_lock:
+            heapq.heappush(
+                self._callbacks, (scheduled.deadline, next(self._sequence), scheduled)
+            )
+        if threading.current_thread() is not threading.main_thread():
+            self.wake()
+        return scheduled
+
+    def run_callbacks(self) -> None:
+        now = time.time()
+        due: list[ScheduledCallback] = []
+        with self._callbacks_lock:
+            while self._callbacks and self._callbacks[0][0] <= now:
+                due.append(heapq.heappop(self._callbacks)[2])
+        for scheduled in due:
+            if not scheduled.cancelled:
+                scheduled.callback()
+
+    def _get_next_callback(self) -> float | None:
+        with self._callbacks_lock:
+            while self._callbacks and self._callbacks[0][2].cancelled:
+                heapq.heappop(self._callbacks)
+            return self._callbacks[0][0] if self._callbacks else None
+
+    def tick(self) -> None:
+        if not self.idle:
+            self._clock.tick(self._framerate)
+        else:
+            timeout = self._idle_timeout
+            for deadline in (self._deadline, self._get_next_callback()):
+                if deadline is not None:
+                    timeout = min(timeout, deadline - time.time())
+            # a timeout of 0 would wait forever
+            event = pygame.event.wait(max(1, round(timeout * 1000)))
+            if event.type != pygame.NOEVENT:
+                self._pending_events.append(event)
+            self._clock.tick()
+        self._deadline = None
+        self.run_callbacks()
+
+    def get_events(self) -> list[pygame.event.Event]:
+        """
+        Replaces pygame.event.get, including the events that ended an idle wait.
+        """
+        events = self._pending_events + pygame.event.get()
+        self._pending_events = []
+        resizes = [event for event in events if event.type == pygame.VIDEORESIZE]
+        if resizes:
+            self._on_resize(resizes[-1].size)
+        if any(event.type != self.WAKE_EVENT for event in events):
+            self.mark_active()
+        return events
+
+    def get_input(self) -> InputSnapshot:
+        """
+        Reads the events of the frame into the current InputSnapshot.
+        """
+        return InputSnapshot.capture(self.get_events())
@@ -1,13 +1,20 @@
+import os
 import pygame
 import sys
 import config
+from asset_registry import AssetRegistry
+from frame_scheduler import FrameScheduler
 from models import ColorConverter, Options, Player
 from sound_manager import SoundManager
+from worker_pool import WorkerPool
 
 
 class GameManager:
     clock: pygame.time.Clock
+    frame_scheduler: FrameScheduler
     screen: pygame.Surface
+    # the menu surface and the screen size it was made for
+    _menu_surface: tuple[tuple[int, int], pygame.Surface] | None = None
     options = Options(
         ip="",
         player_colors={
@@ -24,12 +31,21 @@ class GameManager:
     
     @classmethod
     def start(cls):
+        # on Windows, draw in physical pixels instead of being stretched by the system
+        os.environ.setdefault("SDL_WINDOWS_DPI_AWARENESS", "permonitorv2")
         pygame.init()
         pygame.font.init()
         pygame.mixer.init()
         pygame.display.set_caption("Backgammon")
         cls.clock = pygame.time.Clock()
-        cls.screen = pygame.display.set_mode(config.RESOLUTION)
+        cls.frame_scheduler = FrameScheduler(
+            clock=cls.clock,
+            framerate=config.FRAMERATE,
+            idle_framerate=config.IDLE_FRAMERATE,
+            on_resize=cls.resize,
+        )
+        cls.screen = pygame.display.set_mode(config.RESOLUTION, pygame.RESIZABLE)
+        AssetRegistry.convert_loaded()
         pygame.display.set_icon(config.GAME_ICON)
         cls.sound_manager = SoundManager(
             sounds={
@@ -40,8 +56,33 @@ class GameManager:
             }
         )
 
+    @classmethod
+    def resize(cls, size: tuple[int, int]) -> None:
+        """
+        Called when the window is resized. The screen surface keeps its identity,
+        the screens notice the new size and recompute their layout.
+        """
+        config.set_resolution(size)
+        if cls.screen.get_size() != config.RESOLUTION:
+            cls.screen = pygame.display.set_mode(config.RESOLUTION, pygame.RESIZABLE)
+
+    @classmethod
+    def get_menu_surface(cls) -> pygame.Surface:
+        """
+        Returns the part of the screen the menus are drawn on, in config.MENU
+        coordinates. It is replaced when the window is resized, so it should be
+        taken after the events of the frame were read.
+        """
+        size = cls.screen.get_size()
+        if cls._menu_surface is None or cls._menu_surface[0] != size:
+            rect = config.MENU.copy()
+            rect.center = cls.screen.get_rect().center
+            cls._menu_surface = (size, cls.screen.subsurface(rect))
+        return cls._menu_surface[1]
+
     @staticmethod
     def quit():
+        WorkerPool.shutdown()
         pygame.quit()
         sys.exit()
 
@@ -0,0 +1,50 @@
+from typing import Hashable
+import pygame
+
+
+class DirtyRects:
+    """
+    Tracks which regions of the screen changed since the last frame.
+    Every region is described by a signature, a summary of what is drawn in it.
+    A region is redrawn and presented only when its signature changes, so an idle
+    frame draws nothing and skips presenting altogether.
+    """
+
+    def __init__(self) -> None:
+        self._signatures: dict[str, Hashable] = {}
+        self._rects: list[pygame.Rect] = []
+        self._full = True
+        self._overlay = True
+
+    def begin_frame(self, overlay: bool = False) -> None:
+        """
+        overlay: whether a menu is drawn over the whole frame. The whole frame is
+        redrawn while a menu is shown and once more after it is closed.
+        """
+        self._full = self._full or overlay or self._overlay
+        self._overlay = overlay
+
+    def invalidate(self) -> None:
+        """
+        Redraws the whole frame, the next one if no frame has begun.
+        """
+        self._full = True
+
+    def is_dirty(self, key: str, rects: list[pygame.Rect], signature: Hashable) -> bool:
+        """
+        Returns whether the region has to be redrawn, and marks it for presenting if so.
+        """
+        if not self._full and self._signatures.get(key) == signature:
+            return False
+
+        self._signatures[key] = signature
+        self._rects.extend(rects)
+        return True
+
+    def present(self) -> None:
+        if self._full:
+            pygame.display.flip()
+        elif self._rects:
+            pygame.display.update(self._rects)
+        self._rects = []
+        self._full = False
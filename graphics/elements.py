@@ -1,10 +1,10 @@
 from abc import ABC, abstractmethod
 import math
 import time
-from typing import Callable, Literal
+from typing import Callable, Hashable, Literal
 import pygame
-from pygame.event import Event
 from config import get_font
+from input_snapshot import InputSnapshot
 from graphics.outline_text import OutlineText
 from models import Position
 
@@ -27,17 +27,24 @@ class Element(ABC):
         pass
 
     @abstractmethod
-    def update(self, events: list[pygame.event.Event]) -> None:
+    def update(self, events: InputSnapshot) -> None:
         """
         Updates the element properties. Ususally implemented with is_input_recieved.
         """
         pass
 
-    def click(self, events: list[pygame.event.Event]) -> bool:
+    def click(self, events: InputSnapshot) -> bool:
         return False
 
+    def get_signature(self) -> Hashable:
+        """
+        Changes whenever render would draw something different. Elements that
+        cannot tell return a new object, so they are always redrawn.
+        """
+        return object()
+
     def is_input_recieved(self) -> bool:
-        mouse_position = pygame.mouse.get_pos()
+        mouse_position = InputSnapshot.current.mouse_position
         return not self.disabled and self.rect.collidepoint(mouse_position)
 
     @property
@@ -50,6 +57,9 @@ class Element(ABC):
         self.rect = self.surface.get_rect(**pos.dump())
 
 
+type ButtonState = Literal["base", "hover", "disabled"]
+
+
 class ButtonElement(Element):
     def __init__(
         self,
@@ -69,6 +79,7 @@ class ButtonElement(Element):
             raise Exception("Either image or font must be not None")
 
         self.disabled = False
+        self._text_surfaces: dict[ButtonState, pygame.Surface] = {}
         self._font = font
         self._base_color = base_color
         self._hovering_color = hovering_color
@@ -76,21 +87,15 @@ class ButtonElement(Element):
         self._outline_size = outline_size
         self._outline_color = outline_color
         if font is not None:
-            self._toggle_text_color(self._base_color)
+            self.surface = self._get_text_surface("base")
         self.image = image
         self.surface = image if image is not None else self.surface
         self.position = position
         self.on_click = on_click
         self.sound = sound
 
-    def click(self, events: list[pygame.event.Event]):
-        if (
-            not any(
-                event.type == pygame.MOUSEBUTTONDOWN and event.button == 1
-                for event in events
-            )
-            or not self.is_input_recieved()
-        ):
+    def click(self, events: InputSnapshot):
+        if not events.clicked or not self.is_input_recieved():
             return False
 
         if self.sound:
@@ -101,13 +106,44 @@ class ButtonElement(Element):
     def render(self, screen: pygame.Surface) -> None:
         screen.blit(self.surface, self.rect)
 
-    def _toggle_text_color(self, color: pygame.Color):
+    def get_signature(self) -> Hashable:
+        return (self.surface, tuple(self.rect))
+
+    @property
+    def text_input(self) -> str:
+        return self._text_input
+
+    @text_input.setter
+    def text_input(self, text_input: str):
+        self._text_input = text_input
+        self._text_surfaces = {}
+
+    @property
+    def font(self) -> pygame.font.Font | None:
+        return self._font
+
+    @font.setter
+    def font(self, font: pygame.font.Font | None):
+        self._font = font
+        self._text_surfaces = {}
+
+    def _get_text_surface(self, state: ButtonState) -> pygame.Surface:
+        """
+        The text is rendered once per state and kept until the text or font changes.
+        """
+        if state in self._text_surfaces:
+            return self._text_surfaces[state]
 
-        disabled_color = self._base_color // pygame.Color(2, 2, 2)
-        color = color if not self.disabled else disabled_color
+        match state:
+            case "base":
+                color = self._base_color
+            case "hover":
+                color = self._hovering_color
+            case "disabled":
+                color = self._base_color // pygame.Color(2, 2, 2)
 
         if self._outline_size > 0:
-            self.surface = OutlineText.get_surface(
+            surface = OutlineText.get_surface(
                 text=self.text_input,
                 font=self._font,
                 text_color=color,
@@ -115,12 +151,21 @@ class ButtonElement(Element):
                 outline_width=self._outline_size,
             )
         else:
-            self.surface = self._font.render(self.text_input, True, color)
+            surface = self._font.render(self.text_input, True, color)
+
+        self._text_surfaces[state] = surface
+        return surface
+
+    def update(self, events: InputSnapshot) -> None:
+        if self._font is None:
+            return
 
-    def update(self, events: list[pygame.event.Event]) -> None:
-        color = self._hovering_color if self.is_input_recieved() else self._base_color
-        if self._font is not None:
-            self._toggle_text_color(color)
+        if self.disabled:
+            self.surface = self._get_text_surface("disabled")
+        elif self.is_input_recieved():
+            self.surface = self._get_text_surface("hover")
+        else:
+            self.surface = self._get_text_surface("base")
 
 
 class BetterButtonElement(ButtonElement):
@@ -160,8 +205,11 @@ class BetterButtonElement(ButtonElement):
         self.image = image
         self.sound = sound
 
+        self._state_surfaces: dict[ButtonState, pygame.Surface] = {}
+        self._appearance: Hashable = None
+
         if image is None:
-            self._toggle_color(False)
+            self._text = self._render_text(disabled=False)
             text_rect = self._text.get_rect(center=(0, 0))
             size = (
                 (text_rect.width + padding + font.get_height() / 3),
@@ -182,70 +230,101 @@ class BetterButtonElement(ButtonElement):
         else:
             self._image_rect = image.get_rect(center=self._surface_rect.center)
 
+        self.surface = self._get_state_surface("base")
         self.on_click = on_click
 
     def render(self, screen: pygame.Surface) -> None:
+        screen.blit(self.surface, self.rect)
+
+    def get_signature(self) -> Hashable:
+        return (self.surface, tuple(self.rect))
+
+    def _get_appearance(self) -> Hashable:
+        return (
+            self.text_input,
+            self.image,
+            tuple(self.text_color),
+            tuple(self.text_outline_color),
+            tuple(self.base_color),
+            tuple(self.hovering_color),
+            tuple(self.outline_color),
+        )
+
+    def _get_state_surface(self, state: ButtonState) -> pygame.Surface:
+        """
+        The button is composed once per state and kept until its text, image or colors change.
+        """
+        appearance = self._get_appearance()
+        if appearance != self._appearance:
+            self._appearance = appearance
+            self._state_surfaces = {}
+
+        surface = self._state_surfaces.get(state)
+        if surface is None:
+            surface = self._render_state_surface(state)
+            self._state_surfaces[state] = surface
+        return surface
+
+    def _render_state_surface(self, state: ButtonState) -> pygame.Surface:
+        surface = pygame.Surface(
+            self._surface_rect.size, flags=pygame.SRCALPHA, depth=32
+        )
+        if state == "disabled":
+            color = self.base_color // pygame.Color(2, 2, 2, 1)
+            outline_color = self.outline_color // pygame.Color(2, 2, 2, 1)
+        else:
+            color = self.hovering_color if state == "hover" else self.base_color
+            outline_color = self.outline_color
+
         br = (
             self._border_radius
             if self._border_radius is not None
-            else math.floor(self.rect.height / 4)
+            else math.floor(self._surface_rect.height / 4)
         )
         pygame.draw.rect(
-            surface=self.surface,
-            color=self._displayed_color,
+            surface=surface,
+            color=color,
             rect=self._surface_rect,
             border_radius=br,
         )
         pygame.draw.rect(
-            surface=self.surface,
-            color=self._displayed_outline_color,
+            surface=surface,
+            color=outline_color,
             rect=self._surface_rect,
             width=self._outline_size,
             border_radius=br,
         )
         if self.image is None:
-            self.surface.blit(self._text, self._text_rect)
+            text = self._render_text(disabled=state == "disabled")
+            surface.blit(text, self._text_rect)
         else:
-            self.surface.blit(self.image, self._image_rect)
-
-        screen.blit(self.surface, self.rect)
-
-    def _toggle_color(self, is_hovering: bool):
-        disabled_color = self.base_color // pygame.Color(2, 2, 2, 1)
-        disabled_outline_color = self.outline_color // pygame.Color(2, 2, 2, 1)
-        disabled_text_color = self.text_color // pygame.Color(2, 2, 2, 1)
-        disabled_text_outline_color = self.text_outline_color // pygame.Color(
-            2, 2, 2, 1
-        )
+            surface.blit(self.image, self._image_rect)
+        return surface
 
-        color = self.hovering_color if is_hovering else self.base_color
-        self._displayed_color = color if not self.disabled else disabled_color
-        self._displayed_outline_color = (
-            self.outline_color if not self.disabled else disabled_outline_color
-        )
-
-        if self._font is None:
-            return
+    def _render_text(self, disabled: bool) -> pygame.Surface:
+        text_color = self.text_color
+        text_outline_color = self.text_outline_color
+        if disabled:
+            text_color = text_color // pygame.Color(2, 2, 2, 1)
+            text_outline_color = text_outline_color // pygame.Color(2, 2, 2, 1)
 
-        text_color = self.text_color if not self.disabled else disabled_text_color
-        text_outline_color = (
-            self.text_outline_color
-            if not self.disabled
-            else disabled_text_outline_color
-        )
         if self.text_outline_size > 0:
-            self._text = OutlineText.get_surface(
+            return OutlineText.get_surface(
                 text=self.text_input,
                 font=self._font,
                 text_color=text_color,
                 outline_color=text_outline_color,
                 outline_width=self.text_outline_size,
             )
-        else:
-            self._text = self._font.render(self.text_input, True, text_color)
+        return self._font.render(self.text_input, True, text_color)
 
-    def update(self, events: list[pygame.event.Event]) -> None:
-        self._toggle_color(self.is_input_recieved())
+    def update(self, events: InputSnapshot) -> None:
+        if self.disabled:
+            self.surface = self._get_state_surface("disabled")
+        elif self.is_input_recieved():
+            self.surface = self._get_state_surface("hover")
+        else:
+            self.surface = self._get_state_surface("base")
 
 
 class TrackButtonElement(Element):
@@ -291,11 +370,11 @@ class TrackButtonElement(Element):
                 border_radius=2,
             )
 
-    def update(self, events: list[Event]) -> None:
+    def update(self, events: InputSnapshot) -> None:
         return super().update(events)
 
     def is_input_recieved(self) -> bool:
-        mouse_position = pygame.mouse.get_pos()
+        mouse_position = InputSnapshot.current.mouse_position
 
         return mouse_position[0] - self.surface_rect.left in range(
             self.rect.left, self.rect.right
@@ -379,40 +458,30 @@ class SliderElement(Element):
         pygame.draw.rect(surface, pygame.Color("black"), knob_rect, width=2)
 
     def is_input_recieved(self) -> bool:
-        mouse_position = pygame.mouse.get_pos()
+        mouse_position = InputSnapshot.current.mouse_position
         return not self.disabled and self._slider_rect.collidepoint(mouse_position)
 
-    def click(self, events: list[pygame.event.Event]):
-        if not self.is_input_recieved() or not any(
-            event.type == pygame.MOUSEBUTTONDOWN and event.button == 1
-            for event in events
-        ):
+    def click(self, events: InputSnapshot):
+        if not self.is_input_recieved() or not events.clicked:
             return False
 
-        mouse_position = pygame.mouse.get_pos()
-        self.value = self._position_to_value(mouse_position)
+        self.value = self._position_to_value(events.mouse_position)
         self.drag = True
         if self.sound:
             self.sound.play()
         return True
 
-    def update(self, events: list[pygame.event.Event]) -> None:
+    def update(self, events: InputSnapshot) -> None:
         if not self.is_input_recieved():
-            if any(event.type == pygame.MOUSEBUTTONUP for event in events):
+            if events.released:
                 self.drag = False
             return
 
-        if (
-            pygame.mouse.get_pressed()[0]
-            and self.drag
-            and any(event.type == pygame.MOUSEMOTION for event in events)
-        ):
-            mouse_position = pygame.mouse.get_pos()
-            self.value = self._position_to_value(mouse_position)
+        if events.mouse_pressed[0] and self.drag and events.moved:
+            self.value = self._position_to_value(events.mouse_position)
             return
 
-        mwevents = [event for event in events if event.type == pygame.MOUSEWHEEL]
-        for event in mwevents:
+        for event in events.wheel:
             self.value = (
                 self.value
                 + (self.step if self.step else ((self.max - self.min) / 100)) * event.y
@@ -528,11 +597,13 @@ class TextFieldElement(Element):
         self.on_value_changed = on_value_changed
 
     def is_input_recieved(self) -> bool:
-        mouse_pos = pygame.mouse.get_pos()
+        mouse_pos = InputSnapshot.current.mouse_position
         return self.rect.collidepoint(mouse_pos)
 
-    def update(self, events: list[Event]) -> None:
-        for event in events:
+    def update(self, events: InputSnapshot) -> None:
+        # in the order they arrived, so the keys typed before a click that leaves
+        # the field, and after a click that focuses it, both count
+        for event in events.events:
             if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                 self.disabled = not self.is_input_recieved()
 
@@ -553,19 +624,13 @@ class TextFieldElement(Element):
 
         self.on_value_changed(self.value)
 
-    def click(self, events: list[pygame.event.Event]):
-        if self.is_input_recieved() and any(
-            event.type == pygame.MOUSEBUTTONDOWN and event.button == 1
-            for event in events
-        ):
+    def click(self, events: InputSnapshot):
+        if self.is_input_recieved() and events.clicked:
             if self.sound:
                 self.sound.play()
             self.disabled = False
             return True
-        elif not self.is_input_recieved() and any(
-            event.type == pygame.MOUSEBUTTONDOWN and event.button == 1
-            for event in events
-        ):
+        elif not self.is_input_recieved() and events.clicked:
             self.disabled = True
 
         return False
@@ -630,6 +695,7 @@ class TimerElement(Element):
         self.on_done = on_done
         self.surface = self._get_timer_surface(self.format_timer(0, timer_type))
         self.rect = self.surface.get_rect(**position.dump())
+        self._rendered_signature: Hashable = None
         self.disabled = True
         self.threshold_sound = threshold_sound
 
@@ -642,7 +708,7 @@ class TimerElement(Element):
     def stop(self):
         self.disabled = True
 
-    def update(self, events: list[Event]) -> None:
+    def update(self, events: InputSnapshot) -> None:
         if self.disabled:
             return
 
@@ -682,12 +748,37 @@ class TimerElement(Element):
             outline_width=math.floor(self._font.get_height() / 20),
         )
 
-    def render(self, surface: pygame.Surface) -> None:
-        text = self.format_timer(timer=self.timer, type=self._type)
+    def get_signature(self) -> Hashable:
+        return (
+            self.format_timer(timer=self.timer, type=self._type),
+            self.timer > self._threshold,
+        )
 
-        self.surface = self._get_timer_surface(text)
+    def get_next_change(self) -> float | None:
+        """
+        Returns when the shown text or color changes next, or None while stopped.
+        """
+        if self.disabled:
+            return None
+
+        if self._type == "sec":
+            # the seconds are rounded, so they change on every half second
+            until_change = (self.timer - 0.5) % 1 or 1
+        else:
+            until_change = self.timer % 1 or 1
+
+        if self.timer > self._threshold:
+            until_change = min(until_change, self.timer - self._threshold)
 
-        self.rect = self.surface.get_rect(**self._position.dump())
+        return self._current_time + until_change
+
+    def render(self, surface: pygame.Surface) -> None:
+        signature = self.get_signature()
+        if signature != self._rendered_signature:
+            self._rendered_signature = signature
+            text, _ = signature
+            self.surface = self._get_timer_surface(text)
+            self.rect = self.surface.get_rect(**self._position.dump())
 
         surface.blit(self.surface, self.rect)
 
@@ -699,5 +790,5 @@ class TimerElement(Element):
     def timer(self, time: float):
         self._time = time
 
-    def click(self, events: list[Event]) -> bool:
+    def click(self, events: InputSnapshot) -> bool:
         return super().click(events)
@@ -1,3 +1,5 @@
+import bisect
+from typing import Callable, Hashable
 import pygame
 import pygame.gfxdraw
 import math
@@ -9,6 +11,10 @@ from models import GameState
 from graphics.outline_text import OutlineText
 
 
+type Blit = tuple[pygame.Surface, tuple[int, int]]
+type SpriteKey = tuple[tuple[int, int, int, int], int | tuple[int, int]]
+
+
 class GraphicsManager:
     screen: pygame.Surface
     surface: pygame.Surface
@@ -19,26 +25,70 @@ class GraphicsManager:
 
     RECT: pygame.Rect
 
+    # checker sprites by (color, radius) and home checker sprites by (color, size),
+    # oldest evicted first
+    MAX_PIECE_SPRITES = 16
+    PIECE_SUPERSAMPLING = 4
+    _piece_sprites: dict[SpriteKey, pygame.Surface] = {}
+
+    LAYOUT_ASPECT = (16, 9)
+    # the texts beside the board are sized for a board TEXT_HEIGHT pixels high,
+    # with strips TEXT_SIDE_WIDTH pixels wide
+    TEXT_HEIGHT = 720
+    TEXT_SIDE_WIDTH = 244
+    # the background for the current screen size
+    _background: pygame.Surface | None = None
+
     def __init__(
         self,
         screen: pygame.Surface,
     ) -> None:
         self.screen = screen
+        self._highlighted_indexes: list[int] = []
+        self.create_geometry()
+
+    def create_geometry(self) -> None:
+        """
+        Lays the board out for the current screen size. The static board, the hit grid
+        and the tracks are rebuilt for the new size, and the checker sprites are kept
+        by radius, so a size is rasterized once and no frame is scaled.
+        """
+        self.size = self.screen.get_size()
 
         # postiion relative to screen
-        home_width = self.screen.get_height() * 0.1
+        # the board and the strips beside it take the largest LAYOUT_ASPECT area of the
+        # screen, so a narrow or tall window still leaves room for the texts and buttons
+        width, height = self.size
+        aspect_width, aspect_height = self.LAYOUT_ASPECT
+        board_height = min(height, width * aspect_height // aspect_width)
+        home_width = board_height * 0.1
 
         self.RECT = pygame.Rect(
-            math.floor(
-                (self.screen.get_width() - (self.screen.get_height() + home_width)) / 2
-            ),
-            0,
-            math.floor(screen.get_height() + home_width),
-            screen.get_height(),
+            math.floor((width - (board_height + home_width)) / 2),
+            (height - board_height) // 2,
+            math.floor(board_height + home_width),
+            board_height,
         )
 
         self.surface = pygame.Surface(self.RECT.size)
 
+        # the screen around the board, where the texts and buttons are
+        self.SIDE_RECTS = [
+            rect
+            for rect in (
+                pygame.Rect(0, 0, self.RECT.left, height),
+                pygame.Rect(self.RECT.right, 0, width - self.RECT.right, height),
+                pygame.Rect(self.RECT.left, 0, self.RECT.width, self.RECT.top),
+                pygame.Rect(
+                    self.RECT.left,
+                    self.RECT.bottom,
+                    self.RECT.width,
+                    height - self.RECT.bottom,
+                ),
+            )
+            if rect.width > 0 and rect.height > 0
+        ]
+
         # position relative to self.surface
         self._HOME_RECT = pygame.Rect(
             0,
@@ -95,12 +145,43 @@ class GraphicsManager:
         )
 
         self._piece_radius = math.floor(self._MINI_RECT.width / 2 - 2)
+
+        # scaled in quarter steps, so resizing the window loads few font sizes
+        text_scale = min(
+            self.RECT.height / self.TEXT_HEIGHT, self.RECT.left / self.TEXT_SIDE_WIDTH
+        )
+        self._text_scale = max(1, math.floor(text_scale * 4) / 4)
+
         self.top_tracks_rect = []
         self.bottom_tracks_rect = []
         self.tracks = []
 
         self.create_tracks_rects()
         self.create_home_tracks()
+        self.create_hit_grid()
+        self.highlight_tracks(self._highlighted_indexes)
+        self.hovered_track: int | Player | None = None
+
+        self._static_board: pygame.Surface | None = None
+        self._board_signature: Hashable = None
+
+    def resize(self) -> bool:
+        """
+        Lays the board out again if the screen was resized since, and returns whether it was.
+        """
+        if self.size == self.screen.get_size():
+            return False
+        self.create_geometry()
+        return True
+
+    def scale_text(self, value: int) -> int:
+        return round(value * self._text_scale)
+
+    def scale_text_y(self, y: int) -> int:
+        """
+        Places a text beside the board, at y for a board TEXT_HEIGHT high.
+        """
+        return self.RECT.top + self.scale_text(y)
 
     def create_home_tracks(self) -> None:
         self.home_tracks = {
@@ -125,6 +206,8 @@ class GraphicsManager:
         self.tracks[index].highlighted = highlight
 
     def highlight_tracks(self, highlighted_indexes: list[int]) -> None:
+        # kept to highlight the new tracks when the board is laid out again
+        self._highlighted_indexes = highlighted_indexes
         self.home_tracks[Player.player1].highlighted = any(
             index > 23 for index in highlighted_indexes
         )
@@ -144,14 +227,58 @@ class GraphicsManager:
         Returns the index of hoverd track.
         If no track was clicked, -1 is returned
         """
-        for index, button in enumerate(self.tracks):
-            if button.is_input_recieved() and button.highlighted:
-                return index
+        index = self.hovered_track
+        if isinstance(index, int) and self.tracks[index].highlighted:
+            return index
         return -1
 
     def check_home_track_input(self, player: Player) -> bool:
-        button = self.home_tracks[player]
-        return button.is_input_recieved() and button.highlighted
+        return self.hovered_track == player and self.home_tracks[player].highlighted
+
+    def create_hit_grid(self) -> None:
+        """
+        Splits the board surface into a grid along the edges of all the tracks and
+        maps every pixel column and row to its grid cell, so finding the track at
+        a position takes three lookups.
+        """
+        buttons: list[tuple[int | Player, TrackButtonElement]] = [
+            *enumerate(self.tracks),
+            *self.home_tracks.items(),
+        ]
+        rects = [button.rect for _, button in buttons]
+        x_edges = sorted({edge for rect in rects for edge in (rect.left, rect.right)})
+        y_edges = sorted({edge for rect in rects for edge in (rect.top, rect.bottom)})
+        self._hit_columns = [
+            bisect.bisect_right(x_edges, x) - 1 for x in range(self.RECT.width)
+        ]
+        self._hit_rows = [
+            bisect.bisect_right(y_edges, y) - 1 for y in range(self.RECT.height)
+        ]
+
+        self._hit_grid: dict[tuple[int, int], int | Player] = {}
+        for track, button in buttons:
+            rect = button.rect
+            for column in range(x_edges.index(rect.left), x_edges.index(rect.right)):
+                for row in range(y_edges.index(rect.top), y_edges.index(rect.bottom)):
+                    self._hit_grid[(column, row)] = track
+
+    def get_track_at(self, position: tuple[int, int]) -> int | Player | None:
+        """
+        Returns the index of the track at a position on the screen,
+        the player whose home track is there, or None.
+        """
+        x = position[0] - self.RECT.left
+        y = position[1] - self.RECT.top
+        if not (0 <= x < self.RECT.width and 0 <= y < self.RECT.height):
+            return None
+        return self._hit_grid.get((self._hit_columns[x], self._hit_rows[y]))
+
+    def update_hovered_track(self, mouse_position: tuple[int, int]) -> None:
+        """
+        Called once per frame. check_track_input and check_home_track_input use
+        the track found here instead of reading the mouse again.
+        """
+        self.hovered_track = self.get_track_at(mouse_position)
 
     def create_tracks_rects(self) -> None:
 
@@ -223,69 +350,150 @@ class GraphicsManager:
         player_colors: dict[Player, pygame.Color],
         is_online: bool = False,
     ):
+        self.render_board_surface(game_state=game_state, player_colors=player_colors)
+        self.render_info(
+            game_state=game_state, player_colors=player_colors, is_online=is_online
+        )
 
-        board = game_state.board
-        bar = game_state.bar
-        home = game_state.home
-        score = game_state.score
-        dice = game_state.dice
-        current_turn = game_state.current_turn
+    def render_board_surface(
+        self,
+        game_state: GameState,
+        player_colors: dict[Player, pygame.Color],
+        signature: Hashable = None,
+    ):
+        """
+        Renders the board itself, covering self.RECT. When a signature from
+        get_board_signature is given, the pieces are only drawn again if it changed.
+        """
+        if signature is None or signature != self._board_signature:
+            self._board_signature = signature
+            self.compose_board_surface(
+                game_state=game_state, player_colors=player_colors
+            )
 
-        # whole board + home
-        self.surface.fill("brown")
-        side_color = pygame.Color(246, 224, 135)
-        pygame.draw.rect(self.surface, "black", (0, 0) + self.RECT.size, 2)
+        self.screen.blit(source=self.surface, dest=self.RECT.topleft)
 
-        # left side
-        pygame.draw.rect(self.surface, side_color, self._LEFT_SIDE_RECT)
-        pygame.draw.rect(self.surface, "black", self._LEFT_SIDE_RECT, 2)
+    def compose_board_surface(
+        self,
+        game_state: GameState,
+        player_colors: dict[Player, pygame.Color],
+    ):
+        self.surface.blit(source=self.get_static_board(), dest=(0, 0))
 
-        # right side
-        pygame.draw.rect(self.surface, side_color, self._RIGHT_SIDE_RECT)
-        pygame.draw.rect(
-            self.surface,
-            "black",
-            self._RIGHT_SIDE_RECT,
-            2,
+        # the highlights are drawn outside the tracks, so no piece covers them
+        for button in [*self.tracks, *self.home_tracks.values()]:
+            button.render()
+
+        # every piece is a cached sprite, so the pieces are drawn in one batch
+        self.surface.blits(
+            self.get_pieces_blits(board=game_state.board, player_colors=player_colors)
+            + self.get_bar_pieces_blits(bar=game_state.bar, player_colors=player_colors)
+            + self.get_home_blits(home=game_state.home, player_colors=player_colors),
+            doreturn=False,
         )
 
-        for button in self.tracks:
-            button.render()
+    def render_info(
+        self,
+        game_state: GameState,
+        player_colors: dict[Player, pygame.Color],
+        is_online: bool = False,
+    ):
+        """
+        Renders the dice, score and turn next to the board.
+        """
+        self.render_dice(dice=game_state.dice)
 
-        self.render_tracks()
+        self.render_score(score=game_state.score, player_colors=player_colors)
 
-        self.render_pieces(board=board, player_colors=player_colors)
+        self.render_turn(current_turn=game_state.current_turn, is_online=is_online)
 
-        self.render_bar_pieces(bar=bar, player_colors=player_colors)
+    def get_board_signature(
+        self, version: int, player_colors: dict[Player, pygame.Color]
+    ) -> tuple:
+        """
+        Changes whenever render_board_surface would draw something different.
+        version: Backgammon.version of the rendered game.
+        """
+        return (
+            version,
+            tuple(button.highlighted for button in self.tracks),
+            tuple(button.highlighted for button in self.home_tracks.values()),
+            tuple(tuple(pygame.Color(color)) for color in player_colors.values()),
+        )
 
-        self.render_home(home=home, player_colors=player_colors)
+    def get_info_signature(
+        self,
+        version: int,
+        player_colors: dict[Player, pygame.Color],
+        is_online: bool = False,
+    ) -> tuple:
+        """
+        Changes whenever render_info would draw something different.
+        version: Backgammon.version of the rendered game.
+        """
+        return (
+            version,
+            is_online,
+            tuple(tuple(pygame.Color(color)) for color in player_colors.values()),
+        )
 
-        self.render_dice(dice=dice)
+    def get_static_board(self) -> pygame.Surface:
+        """
+        The parts of the board that never change during a game, rendered once
+        and rebuilt only when the board size changes.
+        """
+        static_board = self._static_board
+        if static_board is None or static_board.get_size() != self.RECT.size:
+            self._static_board = self.render_static_board()
+        return self._static_board
 
-        self.render_score(score=score, player_colors=player_colors)
+    def render_static_board(self) -> pygame.Surface:
+        surface = pygame.Surface(self.RECT.size)
 
-        self.render_turn(current_turn=current_turn, is_online=is_online)
+        # whole board + home
+        surface.fill("brown")
+        side_color = pygame.Color(246, 224, 135)
+        pygame.draw.rect(surface, "black", (0, 0) + self.RECT.size, 2)
 
-        self.screen.blit(source=self.surface, dest=self.RECT.topleft)
+        # left side
+        pygame.draw.rect(surface, side_color, self._LEFT_SIDE_RECT)
+        pygame.draw.rect(surface, "black", self._LEFT_SIDE_RECT, 2)
+
+        # right side
+        pygame.draw.rect(surface, side_color, self._RIGHT_SIDE_RECT)
+        pygame.draw.rect(surface, "black", self._RIGHT_SIDE_RECT, 2)
+
+        self.render_tracks(surface=surface)
+        self.render_home_trays(surface=surface)
 
-    def render_pieces(self, board: list[int], player_colors: pygame.Color):
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        return surface
+
+    def get_pieces_blits(
+        self, board: list[int], player_colors: dict[Player, pygame.Color]
+    ) -> list[Blit]:
         all_rect = self.top_tracks_rect + self.bottom_tracks_rect
+        blits: list[Blit] = []
 
         for index, pieces in enumerate(board):
             player = Player.player1 if pieces > 0 else Player.player2
             color = player_colors[player]
-            self.render_track_pieces(
+            blits += self.get_track_pieces_blits(
                 all_rect[index], color, abs(pieces), index < 12, self._piece_radius
             )
+        return blits
 
     def render_turn(self, current_turn: Player, is_online: bool):
         text = "Player1" if current_turn == Player.player1 else "Player2"
         if is_online:
             text = "YOU" if current_turn == Player.player1 else "OPPONENT"
         OutlineText.render(
-            position=Position(coords=(math.floor(self.RECT.left / 2), 130)),
+            position=Position(
+                coords=(math.floor(self.RECT.left / 2), self.scale_text_y(130))
+            ),
             text=text,
-            font=get_font(30),
+            font=get_font(self.scale_text(30)),
             text_color=pygame.Color("white"),
             outline_color=pygame.Color("black"),
             surface=self.screen,
@@ -294,13 +502,13 @@ class GraphicsManager:
     def render_dice(self, dice: tuple[int, int]):
         OutlineText.render(
             text=str(dice[0]) + " " + str(dice[1]),
-            font=get_font(70),
+            font=get_font(self.scale_text(70)),
             text_color=pygame.Color("white"),
             outline_color=pygame.Color("black"),
             position=Position(
                 coords=(
                     math.floor((self.RECT.right + self.screen.get_width()) / 2),
-                    560,
+                    self.scale_text_y(560),
                 )
             ),
             surface=self.screen,
@@ -309,126 +517,185 @@ class GraphicsManager:
     def render_score(
         self, score: dict[Player, int], player_colors: dict[Player, pygame.Color]
     ):
+        font = get_font(self.scale_text(70))
+        y = self.scale_text_y(60)
         COLON_SCORE_TEXT_RECT = OutlineText.render(
             text=":",
-            font=get_font(70),
+            font=font,
             text_color=pygame.Color("white"),
             outline_color=pygame.Color("black"),
-            position=Position(coords=(math.floor(self.RECT.left / 2), 60)),
+            position=Position(coords=(math.floor(self.RECT.left / 2), y)),
             surface=self.screen,
         )
         
         OutlineText.render(
             text=str(score[Player.player1]),
-            font=get_font(70),
+            font=font,
             text_color=player_colors[Player.player1],
             outline_color=pygame.Color("black"),
-            position=Position(anchor="midleft", coords=(math.floor(COLON_SCORE_TEXT_RECT.right + 10), 60)),
+            position=Position(anchor="midleft", coords=(math.floor(COLON_SCORE_TEXT_RECT.right + 10), y)),
             surface=self.screen,
         )
 
         OutlineText.render(
-            position=Position(anchor="midright", coords=(math.floor(COLON_SCORE_TEXT_RECT.left - 10), 60)),
+            position=Position(anchor="midright", coords=(math.floor(COLON_SCORE_TEXT_RECT.left - 10), y)),
             surface=self.screen,
             text=str(score[Player.player2]),
-            font=get_font(70),
+            font=font,
             text_color=player_colors[Player.player2],
             outline_color=pygame.Color("black"),
         )
 
-    def render_tracks(self) -> None:
+    def render_tracks(self, surface: pygame.Surface) -> None:
         for index, rect in enumerate(self.top_tracks_rect):
             first = rect.topleft
             second = rect.topright
             third = (math.floor((rect.right + rect.left) / 2), rect.bottom)
             color = (0, 0, 0) if index % 2 == 0 else (150, 0, 0)
-            pygame.gfxdraw.filled_polygon(self.surface, (first, second, third), color)
-            pygame.gfxdraw.aapolygon(self.surface, (first, second, third), (0, 0, 0))
+            pygame.gfxdraw.filled_polygon(surface, (first, second, third), color)
+            pygame.gfxdraw.aapolygon(surface, (first, second, third), (0, 0, 0))
 
         for index, rect in enumerate(self.bottom_tracks_rect):
             first = rect.bottomleft
             second = rect.bottomright
             third = (math.floor((rect.right + rect.left) / 2), rect.top)
             color = (0, 0, 0) if index % 2 == 0 else (150, 0, 0)
-            pygame.gfxdraw.filled_polygon(self.surface, (first, second, third), color)
-            pygame.gfxdraw.aapolygon(self.surface, (first, second, third), (0, 0, 0))
+            pygame.gfxdraw.filled_polygon(surface, (first, second, third), color)
+            pygame.gfxdraw.aapolygon(surface, (first, second, third), (0, 0, 0))
 
-    def render_track_pieces(
+    def get_track_pieces_blits(
         self,
         rect: pygame.Rect,
         color: pygame.Color,
         number: int,
         is_top: bool,
         radius: int,
-    ):
+    ) -> list[Blit]:
+        sprite = self.get_piece_sprite(color=color, radius=radius)
+        blits: list[Blit] = []
         for i in range(number):
             new_y = (
                 (rect.top + radius * (2 * i + 1))
                 if is_top
                 else (rect.bottom - radius * (2 * i + 1))
             )
-            center = (rect.centerx, new_y)
-            self.render_piece(
-                surface=self.surface, center=center, color=color, radius=radius
-            )
+            blits.append((sprite, (rect.centerx - radius, new_y - radius)))
+        return blits
 
-    @staticmethod
+    @classmethod
     def render_piece(
+        cls,
         surface: pygame.Surface,
         center: tuple[int, int],
         color: pygame.Color,
         radius: int,
     ):
-        pygame.gfxdraw.filled_circle(surface, center[0], center[1], radius, color)
-        pygame.gfxdraw.aacircle(surface, center[0], center[1], radius, (0, 0, 0))
-        pygame.gfxdraw.aacircle(
-            surface, center[0], center[1], math.floor(radius / 2), (0, 0, 0)
+        surface.blit(
+            source=cls.get_piece_sprite(color=color, radius=radius),
+            dest=(center[0] - radius, center[1] - radius),
         )
 
-    def render_bar_pieces(self, bar: dict[Player, int], player_colors: pygame.Color):
-        # player1
-        color = player_colors[Player.player1]
-        radius = self._piece_radius
-        number = bar[Player.player1]
-        centery = math.floor(
-            (self._LEFT_SIDE_RECT.right + self._RIGHT_SIDE_RECT.left) / 2
+    @classmethod
+    def _get_sprite(
+        cls,
+        key: SpriteKey,
+        render: Callable[[], pygame.Surface],
+    ) -> pygame.Surface:
+        sprite = cls._piece_sprites.get(key)
+        if sprite is None:
+            if len(cls._piece_sprites) >= cls.MAX_PIECE_SPRITES:
+                del cls._piece_sprites[next(iter(cls._piece_sprites))]
+            sprite = render()
+            if pygame.display.get_surface() is not None:
+                sprite = sprite.convert_alpha()
+            cls._piece_sprites[key] = sprite
+        return sprite
+
+    @classmethod
+    def get_piece_sprite(cls, color: pygame.Color, radius: int) -> pygame.Surface:
+        return cls._get_sprite(
+            key=(tuple(pygame.Color(color)), radius),
+            render=lambda: cls.render_piece_sprite(color=color, radius=radius),
         )
-        for counter in range(number):
-            counter_center = (
-                centery,
-                math.floor(
-                    (self.RECT.height / 4 - radius * number)
-                    + (counter * 2 + 1) * radius
-                ),
-            )
-            self.render_piece(
-                surface=self.surface, center=counter_center, color=color, radius=radius
-            )
 
-        # player2
-        color = player_colors[Player.player2]
-        number = bar[Player.player2]
-        for counter in range(number):
-            counter_center = (
-                centery,
-                math.floor(
-                    (self.RECT.height / 4 * 3 - radius * number)
-                    + (counter * 2 + 1) * radius
-                ),
-            )
-            self.render_piece(
-                surface=self.surface, center=counter_center, color=color, radius=radius
-            )
+    @classmethod
+    def get_home_piece_sprite(
+        cls, color: pygame.Color, size: tuple[int, int]
+    ) -> pygame.Surface:
+        return cls._get_sprite(
+            key=(tuple(pygame.Color(color)), size),
+            render=lambda: cls.render_home_piece_sprite(color=color, size=size),
+        )
 
-    def render_home(self, home: dict[Player, int], player_colors: pygame.Color) -> None:
+    @classmethod
+    def render_piece_sprite(cls, color: pygame.Color, radius: int) -> pygame.Surface:
+        """
+        draw.circle does not antialias, so the checker is drawn at a larger scale and
+        smoothscaled down, which averages the edges into alpha. The black outline
+        hides the darkening of the edge by the transparent pixels.
+        """
+        scale = cls.PIECE_SUPERSAMPLING
+        size = radius * 2 + 1
+        large = pygame.Surface((size * scale, size * scale), flags=pygame.SRCALPHA)
+        large.fill((0, 0, 0, 0))
+        center = large.get_rect().center
+        pygame.draw.circle(large, color, center, (radius + 0.5) * scale)
+        for ring in (radius, math.floor(radius / 2)):
+            pygame.draw.circle(large, "black", center, (ring + 0.5) * scale, scale)
+        return pygame.transform.smoothscale(large, (size, size))
 
+    @staticmethod
+    def render_home_piece_sprite(
+        color: pygame.Color, size: tuple[int, int]
+    ) -> pygame.Surface:
+        sprite = pygame.Surface(size, flags=pygame.SRCALPHA)
+        sprite.fill((0, 0, 0, 0))
+        rect = sprite.get_rect()
+        pygame.draw.rect(
+            surface=sprite, color=color, rect=rect, width=0, border_radius=2
+        )
         pygame.draw.rect(
-            surface=self.surface, color="black", rect=self._HOME_RECT, width=2
+            surface=sprite, color="black", rect=rect, width=1, border_radius=2
         )
+        return sprite
+
+    @classmethod
+    def forget_piece_color(cls, color: pygame.Color) -> None:
+        """
+        Drops the sprites of a color that is no longer used.
+        """
+        color_key = tuple(pygame.Color(color))
+        for key in [key for key in cls._piece_sprites if key[0] == color_key]:
+            del cls._piece_sprites[key]
+
+    def get_bar_pieces_blits(
+        self, bar: dict[Player, int], player_colors: dict[Player, pygame.Color]
+    ) -> list[Blit]:
+        radius = self._piece_radius
+        centery = math.floor(
+            (self._LEFT_SIDE_RECT.right + self._RIGHT_SIDE_RECT.left) / 2
+        )
+        blits: list[Blit] = []
+        # player1 on the top half, player2 on the bottom half
+        for player, middle in (
+            (Player.player1, self.RECT.height / 4),
+            (Player.player2, self.RECT.height / 4 * 3),
+        ):
+            sprite = self.get_piece_sprite(color=player_colors[player], radius=radius)
+            number = bar[player]
+            for counter in range(number):
+                top = math.floor(
+                    (middle - radius * number) + (counter * 2 + 1) * radius
+                ) - radius
+                blits.append((sprite, (centery - radius, top)))
+        return blits
+
+    def render_home_trays(self, surface: pygame.Surface) -> None:
+        pygame.draw.rect(surface=surface, color="black", rect=self._HOME_RECT, width=2)
 
         # top home rect player 2
         pygame.draw.rect(
-            surface=self.surface,
+            surface=surface,
             color="black",
             rect=self._HOME_TRACK_TOP_RECT,
             width=0,
@@ -437,48 +704,48 @@ class GraphicsManager:
 
         # bottom home rect player 1
         pygame.draw.rect(
-            surface=self.surface,
+            surface=surface,
             color="black",
             rect=self._HOME_TRACK_BOTTOM_RECT,
             width=0,
             border_radius=3,
         )
 
+    def get_home_blits(
+        self, home: dict[Player, int], player_colors: dict[Player, pygame.Color]
+    ) -> list[Blit]:
         piece_height = self._HOME_TRACK_TOP_RECT.height / 15
         piece_width = self._HOME_TRACK_TOP_RECT.width
-        # render top pieces
-        player = Player.player2
-        self.home_tracks[player].render()
-        for piece in range(home[player]):
-            color = player_colors[player]
-            top = self._HOME_TRACK_TOP_RECT.top + piece * piece_height
-            left = self._HOME_TRACK_TOP_RECT.left
-            rect = pygame.Rect(left, top, piece_width, piece_height)
-            pygame.draw.rect(
-                surface=self.surface, color=color, rect=rect, width=0, border_radius=2
-            )
-            pygame.draw.rect(
-                surface=self.surface, color="black", rect=rect, width=1, border_radius=2
-            )
+        blits: list[Blit] = []
+        for player in (Player.player2, Player.player1):
+            for piece in range(home[player]):
+                if player == Player.player2:
+                    # top pieces
+                    top = self._HOME_TRACK_TOP_RECT.top + piece * piece_height
+                    left = self._HOME_TRACK_TOP_RECT.left
+                else:
+                    # bottom pieces
+                    top = self._HOME_TRACK_BOTTOM_RECT.bottom - (piece + 1) * piece_height
+                    left = self._HOME_TRACK_BOTTOM_RECT.left
+                rect = pygame.Rect(left, top, piece_width, piece_height)
+                sprite = self.get_home_piece_sprite(
+                    color=player_colors[player], size=rect.size
+                )
+                blits.append((sprite, rect.topleft))
+        return blits
 
-        # render bottom pieces
-        player = Player.player1
-        self.home_tracks[player].render()
-        for piece in range(home[player]):
-            color = player_colors[player]
-            top = self._HOME_TRACK_BOTTOM_RECT.bottom - (piece + 1) * piece_height
-            left = self._HOME_TRACK_BOTTOM_RECT.left
-            rect = pygame.Rect(left, top, piece_width, piece_height)
-            pygame.draw.rect(
-                surface=self.surface, color=color, rect=rect, width=0, border_radius=2
-            )
-            pygame.draw.rect(
-                surface=self.surface, color="black", rect=rect, width=1, border_radius=2
-            )
+    @classmethod
+    def get_background(cls, size: tuple[int, int]) -> pygame.Surface:
+        """
+        Returns the background rasterized for a screen size. Only the current size is kept.
+        """
+        if cls._background is None or cls._background.get_size() != size:
+            cls._background = config.render_image("BACKGROUND", size)
+        return cls._background
 
-    @staticmethod
-    def render_background(screen: pygame.Surface):
-        screen.blit(config.BACKGROUND, (0, 0))
+    @classmethod
+    def render_background(cls, screen: pygame.Surface):
+        screen.blit(cls.get_background(screen.get_size()), (0, 0))
 
 
 def gradient_surface(
@@ -1,11 +1,20 @@
+from collections import OrderedDict
 import pygame
 
 from models import Position
 
+type SurfaceKey = tuple[str, pygame.font.Font, tuple[int, ...], tuple[int, ...], int]
+
 
 class OutlineText:
     _circle_cache: dict[int, list[tuple[int, int]]] = {}
 
+    # rendered surfaces, least recently used first
+    MAX_CACHED_SURFACES = 256
+    _surface_cache: OrderedDict[SurfaceKey, pygame.Surface] = OrderedDict()
+    cache_hits = 0
+    cache_misses = 0
+
     def __init__(
         self,
         position: Position,
@@ -51,6 +60,57 @@ class OutlineText:
         text_color: pygame.Color = pygame.Color("black"),
         outline_color: pygame.Color = pygame.Color(255, 255, 255),
         outline_width: int = 2,
+    ) -> pygame.Surface:
+        """
+        Returns a cached surface when the same text was rendered recently.
+        The surface is shared between callers and must not be drawn on.
+        """
+        key = (
+            text,
+            font,
+            tuple(pygame.Color(text_color)),
+            tuple(pygame.Color(outline_color)),
+            outline_width,
+        )
+        surface = cls._surface_cache.get(key)
+        if surface is not None:
+            cls.cache_hits += 1
+            cls._surface_cache.move_to_end(key)
+            return surface
+
+        cls.cache_misses += 1
+        surface = cls._render_surface(
+            text=text,
+            font=font,
+            text_color=text_color,
+            outline_color=outline_color,
+            outline_width=outline_width,
+        )
+        cls._surface_cache[key] = surface
+        if len(cls._surface_cache) > cls.MAX_CACHED_SURFACES:
+            cls._surface_cache.popitem(last=False)
+        return surface
+
+    @classmethod
+    def cache_info(cls) -> dict[str, int]:
+        return {
+            "hits": cls.cache_hits,
+            "misses": cls.cache_misses,
+            "size": len(cls._surface_cache),
+        }
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        cls._surface_cache.clear()
+
+    @classmethod
+    def _render_surface(
+        cls,
+        text: str,
+        font: pygame.font.Font,
+        text_color: pygame.Color,
+        outline_color: pygame.Color,
+        outline_width: int,
     ) -> pygame.Surface:
         textsurface = font.render(text, True, text_color).convert_alpha()
         w = textsurface.get_width() + 2 * outline_width
@@ -0,0 +1,67 @@
+import json
+import pygame
+
+
+class TextureAtlas:
+    """
+    Many images packed into one surface, built by build_atlas.py.
+    The index maps every image name to its rect in the surface.
+    """
+
+    def __init__(self, surface: pygame.Surface, index: dict[str, pygame.Rect]) -> None:
+        self.surface = surface
+        self.index = index
+        self._subsurfaces: dict[str, pygame.Surface] = {}
+
+    @classmethod
+    def load(cls, image_path: str, index_path: str) -> "TextureAtlas":
+        with open(index_path) as index_file:
+            index = json.load(index_file)
+        return cls(
+            surface=pygame.image.load(image_path),
+            index={name: pygame.Rect(rect) for name, rect in index.items()},
+        )
+
+    def get_size(self, name: str) -> tuple[int, int] | None:
+        rect = self.index.get(name)
+        return rect.size if rect is not None else None
+
+    def get(self, name: str) -> pygame.Surface:
+        """
+        Returns the image as a subsurface, which shares its pixels with the atlas.
+        """
+        subsurface = self._subsurfaces.get(name)
+        if subsurface is None:
+            subsurface = self.surface.subsurface(self.index[name])
+            self._subsurfaces[name] = subsurface
+        return subsurface
+
+    def convert_alpha(self) -> "TextureAtlas":
+        return TextureAtlas(surface=self.surface.convert_alpha(), index=self.index)
+
+
+def pack(
+    images: dict[str, pygame.Surface], max_width: int = 512, padding: int = 1
+) -> TextureAtlas:
+    """
+    Packs the images in shelves, tallest first.
+    """
+    index: dict[str, pygame.Rect] = {}
+    x = y = shelf_height = width = 0
+    for name, image in sorted(
+        images.items(), key=lambda item: item[1].get_height(), reverse=True
+    ):
+        image_width, image_height = image.get_size()
+        if x > 0 and x + image_width > max_width:
+            x = 0
+            y += shelf_height + padding
+            shelf_height = 0
+        index[name] = pygame.Rect(x, y, image_width, image_height)
+        x += image_width + padding
+        shelf_height = max(shelf_height, image_height)
+        width = max(width, x - padding)
+
+    surface = pygame.Surface((width, y + shelf_height), flags=pygame.SRCALPHA, depth=32)
+    for name, rect in index.items():
+        surface.blit(images[name], rect)
+    return TextureAtlas(surface=surface, index=index)
@@ -0,0 +1,82 @@
+from contextlib import contextmanager
+from typing import Iterator
+import pygame
+
+
+class InputSnapshot:
+    """
+    The input of one frame. The events are read once, grouped by type, and the mouse
+    is sampled once, so elements ask the snapshot instead of scanning the events or
+    calling pygame.mouse themselves. A snapshot can be built from recorded events and
+    mouse state to replay input without a display.
+    """
+
+    current: "InputSnapshot"
+
+    def __init__(
+        self,
+        events: list[pygame.event.Event],
+        mouse_position: tuple[int, int] = (-1, -1),
+        mouse_pressed: tuple[bool, bool, bool] = (False, False, False),
+    ) -> None:
+        self.events = events
+        self.mouse_position = mouse_position
+        self.mouse_pressed = mouse_pressed
+        self._by_type: dict[int, list[pygame.event.Event]] = {}
+        for event in events:
+            self._by_type.setdefault(event.type, []).append(event)
+
+        self.clicked = any(
+            event.button == 1 for event in self.get(pygame.MOUSEBUTTONDOWN)
+        )
+        self.released = pygame.MOUSEBUTTONUP in self._by_type
+        self.moved = pygame.MOUSEMOTION in self._by_type
+        self.quit = pygame.QUIT in self._by_type
+
+    @classmethod
+    def capture(cls, events: list[pygame.event.Event]) -> "InputSnapshot":
+        """
+        Samples the mouse and makes the snapshot the current one.
+        """
+        cls.current = cls(
+            events=events,
+            mouse_position=pygame.mouse.get_pos(),
+            mouse_pressed=pygame.mouse.get_pressed(),
+        )
+        return cls.current
+
+    @contextmanager
+    def relative_to(self, surface: pygame.Surface) -> Iterator["InputSnapshot"]:
+        """
+        Makes the snapshot with the mouse in the coordinates of a subsurface the
+        current one, for elements drawn on it, until the block ends.
+        """
+        x, y = surface.get_abs_offset()
+        snapshot = InputSnapshot(
+            events=self.events,
+            mouse_position=(self.mouse_position[0] - x, self.mouse_position[1] - y),
+            mouse_pressed=self.mouse_pressed,
+        )
+        previous = InputSnapshot.current
+        InputSnapshot.current = snapshot
+        try:
+            yield snapshot
+        finally:
+            InputSnapshot.current = previous
+
+    def get(self, event_type: int) -> list[pygame.event.Event]:
+        """
+        Returns the events of a type in the order they arrived.
+        """
+        return self._by_type.get(event_type, [])
+
+    @property
+    def wheel(self) -> list[pygame.event.Event]:
+        return self.get(pygame.MOUSEWHEEL)
+
+    @property
+    def keys(self) -> list[pygame.event.Event]:
+        return self.get(pygame.KEYDOWN)
+
+
+InputSnapshot.current = InputSnapshot(events=[])
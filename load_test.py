@@ -0,0 +1,291 @@
+"""
+Load test for the online game server.
+
+Starts one BGServer per room on localhost and plays bot games in every room through the
+real protocol: the simulated player2 sends Move and ServerFlags messages while the host
+side plays directly on the server, like LocalClientGame does.
+
+    python load_test.py --rooms 20 --games 2 --spectators 5
+"""
+
+import argparse
+import asyncio
+import contextlib
+import logging
+import os
+import statistics
+import time
+
+import psutil
+from pydantic_extra_types.color import Color
+
+from backgammon import Backgammon, BackgammonAI
+from logs import setup_logging
+from metrics import Histogram
+from models import Move, OnlineGameState, Player, ScoredMoves, ServerFlags
+from models import SessionRequest
+from network import BGServer, receive_message, send_keepalives, send_message
+
+HOST = "127.0.0.1"
+
+
+class LoadTestStats:
+    def __init__(self) -> None:
+        self.latencies: list[float] = []
+        self.messages = 0
+        self.games = 0
+        self.failures: dict[str, int] = {}
+        self.spectator_frames = 0
+
+    def fail(self, reason: str) -> None:
+        self.failures[reason] = self.failures.get(reason, 0) + 1
+
+
+async def get_best_moves(game: Backgammon) -> list[Move]:
+    """
+    Runs the bot on its own thread and returns its moves in the order they should be played.
+    """
+    loop = asyncio.get_running_loop()
+    future: asyncio.Future[ScoredMoves] = loop.create_future()
+    BackgammonAI.get_best_move(
+        game=game,
+        callback=lambda moves: loop.call_soon_threadsafe(future.set_result, moves),
+    )
+    scored_moves = await future
+    return list(reversed(scored_moves.moves))
+
+
+def play_host_turn(server: BGServer, moves: list[Move]) -> None:
+    for move in moves:
+        server.move_piece(move)
+    server.done_turn()
+
+
+class SimulatedClient:
+    def __init__(
+        self, server: BGServer, port: int, stats: LoadTestStats, timeout: float
+    ) -> None:
+        self.server = server
+        self.port = port
+        self.stats = stats
+        self.timeout = timeout
+
+    async def request(self, data) -> OnlineGameState:
+        start = time.perf_counter()
+        await send_message(writer=self.writer, data=data)
+        response = await asyncio.wait_for(
+            receive_message(self.reader), timeout=self.timeout
+        )
+        self.stats.latencies.append(time.perf_counter() - start)
+        self.stats.messages += 2
+        return response
+
+    async def play(self, games: int, max_turns: int) -> None:
+        self.reader, self.writer = await asyncio.open_connection(
+            host=HOST, port=self.port
+        )
+        try:
+            await send_message(writer=self.writer, data=SessionRequest())
+            await asyncio.wait_for(receive_message(self.reader), timeout=self.timeout)
+            self.stats.messages += 2
+
+            for _ in range(games):
+                await self.play_game(max_turns=max_turns)
+
+            await send_message(writer=self.writer, data=ServerFlags.leave)
+            self.stats.messages += 1
+        finally:
+            self.writer.close()
+            await self.writer.wait_closed()
+
+    async def play_game(self, max_turns: int) -> None:
+        state = await self.request(ServerFlags.get_current_state)
+        total_score = sum(state.score.values())
+
+        for _ in range(max_turns):
+            if state.current_turn == Player.player1:
+                moves = await get_best_moves(Backgammon([state]))
+                for move in moves:
+                    state = await self.request(move)
+                state = await self.request(ServerFlags.done)
+            else:
+                host_game = self.server.online_backgammon.game
+                moves = await get_best_moves(host_game)
+                await asyncio.to_thread(play_host_turn, self.server, moves)
+                state = await self.request(ServerFlags.get_current_state)
+
+            if sum(state.score.values()) > total_score:
+                self.stats.games += 1
+                return
+
+        self.stats.fail("turn limit")
+
+
+async def watch(port: int, stats: LoadTestStats, until: asyncio.Event) -> None:
+    reader, writer = await asyncio.open_connection(host=HOST, port=port)
+    await send_message(writer=writer, data=SessionRequest(spectator=True))
+
+    async def count_frames():
+        while True:
+            await receive_message(reader)
+            stats.spectator_frames += 1
+
+    frames_task = asyncio.create_task(count_frames())
+    keepalive_task = asyncio.create_task(send_keepalives(writer))
+    await until.wait()
+    frames_task.cancel()
+    keepalive_task.cancel()
+    await asyncio.gather(frames_task, keepalive_task, return_exceptions=True)
+    writer.close()
+    await writer.wait_closed()
+
+
+async def run_room(
+    server: BGServer,
+    port: int,
+    stats: LoadTestStats,
+    args: argparse.Namespace,
+) -> None:
+    done = asyncio.Event()
+    spectators = [
+        asyncio.create_task(watch(port=port, stats=stats, until=done))
+        for _ in range(args.spectators)
+    ]
+    client = SimulatedClient(
+        server=server, port=port, stats=stats, timeout=args.timeout
+    )
+    try:
+        await client.play(games=args.games, max_turns=args.max_turns)
+    except TimeoutError:
+        stats.fail("timeout")
+    except (ConnectionError, asyncio.IncompleteReadError):
+        stats.fail("connection lost")
+    finally:
+        done.set()
+        for result in await asyncio.gather(*spectators, return_exceptions=True):
+            if isinstance(result, Exception):
+                stats.fail("spectator")
+
+
+def get_threads_cpu_time(thread_ids: set[int]) -> float:
+    return sum(
+        thread.user_time + thread.system_time
+        for thread in psutil.Process().threads()
+        if thread.id in thread_ids
+    )
+
+
+def merge_histograms(servers: list[BGServer], name: str) -> Histogram:
+    merged = Histogram()
+    for server in servers:
+        for key, histogram in server.metrics.snapshot()["histograms"].items():
+            if key.split("{")[0] == name:
+                merged.count += histogram["count"]
+                merged.sum += histogram["sum"]
+    return merged
+
+
+def print_report(
+    stats: LoadTestStats,
+    duration: float,
+    process_cpu: float,
+    servers_cpu: float,
+    servers: list[BGServer],
+) -> None:
+    games = max(stats.games, 1)
+    print(f"rooms:              {len(servers)}")
+    print(f"games played:       {stats.games}")
+    print(f"duration:           {duration:.2f}s")
+    print(f"requests:           {len(stats.latencies)}")
+    print(f"messages/sec:       {stats.messages / duration:.1f}")
+    if len(stats.latencies) > 1:
+        quantiles = statistics.quantiles(stats.latencies, n=100)
+        for name, index in (("p50", 49), ("p95", 94), ("p99", 98)):
+            print(f"latency {name}:        {quantiles[index] * 1000:.2f}ms")
+    for label, name in (
+        ("handler mean:", "handler_latency_seconds"),
+        ("validation mean:", "move_validation_seconds"),
+    ):
+        histogram = merge_histograms(servers=servers, name=name)
+        if histogram.count:
+            print(f"{label:<20}{histogram.sum / histogram.count * 1000:.3f}ms")
+    print(f"server CPU/game:    {servers_cpu / games * 1000:.1f}ms")
+    print(f"total CPU/game:     {process_cpu / games * 1000:.1f}ms (includes bots)")
+    if stats.spectator_frames:
+        print(f"spectator frames:   {stats.spectator_frames}")
+    failures = ", ".join(f"{reason}: {n}" for reason, n in stats.failures.items())
+    print(f"failures:           {sum(stats.failures.values())} {failures}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--rooms", type=int, default=10)
+    parser.add_argument("--games", type=int, default=1, help="games per room")
+    parser.add_argument("--spectators", type=int, default=0, help="per room")
+    parser.add_argument("--port", type=int, default=7000, help="port of the first room")
+    parser.add_argument("--max-turns", type=int, default=400)
+    parser.add_argument("--timeout", type=float, default=30)
+    parser.add_argument("--verbose", action="store_true", help="show server output")
+    args = parser.parse_args()
+
+    setup_logging(logging.DEBUG if args.verbose else logging.WARNING)
+
+    stats = LoadTestStats()
+    process = psutil.Process()
+
+    with contextlib.ExitStack() as stack:
+        if not args.verbose:
+            stack.enter_context(
+                contextlib.redirect_stdout(stack.enter_context(open(os.devnull, "w")))
+            )
+
+        servers = [
+            BGServer(
+                local_color=Color("white"),
+                online_color=Color("black"),
+                port=args.port + room,
+                timeout=args.timeout,
+                host=HOST,
+            )
+            for room in range(args.rooms)
+        ]
+        for server in servers:
+            server.run_server()
+        time.sleep(0.5)
+
+        server_threads = {server.server_thread.native_id for server in servers}
+        servers_cpu = get_threads_cpu_time(server_threads)
+        cpu_times = process.cpu_times()
+        start = time.perf_counter()
+
+        async def run_rooms():
+            await asyncio.gather(
+                *(
+                    run_room(server=server, port=args.port + room, stats=stats, args=args)
+                    for room, server in enumerate(servers)
+                )
+            )
+
+        asyncio.run(run_rooms())
+
+        duration = time.perf_counter() - start
+        cpu_times_end = process.cpu_times()
+        process_cpu = (cpu_times_end.user + cpu_times_end.system) - (
+            cpu_times.user + cpu_times.system
+        )
+        servers_cpu = get_threads_cpu_time(server_threads) - servers_cpu
+
+        for server in servers:
+            server.stop_server()
+
+    print_report(
+        stats=stats,
+        duration=duration,
+        process_cpu=process_cpu,
+        servers_cpu=servers_cpu,
+        servers=servers,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+import atexit
+import logging
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
+import time
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Lets through at most `rate` records of the same message per `period` seconds.
+    Records are grouped by their unformatted message, so log with arguments
+    (`logger.debug("Received %s", data)`) rather than f-strings.
+    """
+
+    def __init__(self, rate: int = 5, period: float = 1) -> None:
+        super().__init__()
+        self._rate = rate
+        self._period = period
+        # message -> (window start, records in window, suppressed records)
+        self._windows: dict[tuple[str, str], tuple[float, int, int]] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        key = (record.name, str(record.msg))
+        now = time.monotonic()
+        start, count, suppressed = self._windows.get(key, (now, 0, 0))
+
+        if now - start > self._period:
+            if suppressed:
+                record.msg = f"{record.msg} ({suppressed} similar messages suppressed)"
+            start, count, suppressed = now, 0, 0
+
+        if count >= self._rate:
+            self._windows[key] = (start, count, suppressed + 1)
+            return False
+
+        self._windows[key] = (start, count + 1, suppressed)
+        return True
+
+
+def setup_logging(level: int = logging.INFO) -> None:
+    """
+    Writes the log from a background thread so logging never blocks the
+    game loop or the server's event loop on terminal I/O.
+    """
+    queue = SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(
+        logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+    )
+    listener = QueueListener(queue, stream_handler)
+
+    queue_handler = QueueHandler(queue)
+    queue_handler.addFilter(RateLimitFilter())
+
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.addHandler(queue_handler)
+
+    listener.start()
+    atexit.register(listener.stop)
@@ -1,11 +1,60 @@
-from game_manager import GameManager
+import argparse
+import logging
+from typing import Callable
+from logs import setup_logging
+from startup_profiler import StartupProfiler
+
+
+def parse_resolution(value: str) -> tuple[int, int]:
+    try:
+        width, height = (int(part) for part in value.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected WIDTHxHEIGHT, got {value!r}")
+    return width, height
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Backgammon")
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="print the import and asset loading times once the first frame is shown",
+    )
+    parser.add_argument(
+        "--resolution",
+        type=parse_resolution,
+        help="the size of the window, like 2560x1440. The window can also be resized",
+    )
+    args = parser.parse_args()
+
+    # the game modules are imported here so their import can be profiled
+    profiler = StartupProfiler()
+    if args.profile_startup:
+        profiler.install()
+
+    setup_logging(logging.INFO)
+    from game_manager import GameManager
+    from asset_registry import AssetRegistry
+    from worker_pool import WorkerPool
+    import config
+
+    if args.resolution is not None:
+        config.set_resolution(args.resolution)
     GameManager.start()
     from menus.screens import MainScreen
+
+    def after_first_frame(callback: Callable[[], None]):
+        # callbacks run when a frame starts, so the second one runs after the first frame
+        GameManager.frame_scheduler.call_later(
+            0, lambda: GameManager.frame_scheduler.call_later(0, callback)
+        )
+
+    after_first_frame(lambda: WorkerPool.submit(AssetRegistry.preload))
+    if args.profile_startup:
+        after_first_frame(profiler.report)
+
     MainScreen.start(GameManager.screen, GameManager.clock)
     GameManager.quit()
-    
+
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
@@ -16,6 +16,7 @@ from menus.menus import OptionsMenu
 from models import ColorConverter, GameState, Move, MoveType, OnlineGameState, ScoredMoves, ServerFlags
 from models import Player
 from network import BGServer, NetworkClient
+from frame_scheduler import FrameScheduler
 
 
 class BotGame(GameScreen):
@@ -38,25 +39,17 @@ class BotGame(GameScreen):
             cls.setup_bot()
 
         while cls.run:
-            clock.tick(config.FRAMERATE)
+            GameManager.frame_scheduler.tick()
             cursor = pygame.SYSTEM_CURSOR_ARROW
-            GraphicsManager.render_background(screen=screen)
-
-            cls.render_board(is_online=True)
 
             if cls.bot and time.time() - cls.bot_current_time > 1:
                 cls.move_bot(on_game_over=cls.done_turn)
 
-            events = pygame.event.get()
+            events = GameManager.frame_scheduler.get_input()
 
             cls.check_quit(events=events, quit=GameManager.quit)
 
-            cls.render_elements(
-                screen=screen,
-                elements=cls.all_elements,
-                events=events,
-                update_condition=not cls.is_screen_on_top(),
-            )
+            cls.render_game(screen=screen, events=events)
 
             cls.update_game_buttons()
             cls.highlight_tracks()
@@ -81,7 +74,7 @@ class BotGame(GameScreen):
             else:
                 pygame.mouse.set_cursor(cursor)
 
-            pygame.display.flip()
+            cls.dirty_rects.present()
 
     @classmethod
     def is_my_turn(cls) -> bool:
@@ -170,26 +163,18 @@ class OfflineGame(GameScreen):
         cls.start_timer()
 
         while cls.run:
-            clock.tick(config.FRAMERATE)
+            GameManager.frame_scheduler.tick()
             cursor = pygame.SYSTEM_CURSOR_ARROW
-            GraphicsManager.render_background(screen=screen)
 
             if cls.bot and time.time() - cls.bot_current_time > 1:
                 cls.move_bot(on_game_over=cls.done_turn)
 
-            cls.render_board()
-
             cls.update_game_buttons()
 
-            events = pygame.event.get()
+            events = GameManager.frame_scheduler.get_input()
             cls.check_quit(events=events, quit=GameManager.quit)
 
-            cls.render_elements(
-                screen=screen,
-                elements=cls.all_elements,
-                update_condition=not cls.is_screen_on_top(),
-                events=events,
-            )
+            cls.render_game(screen=screen, events=events)
 
             cls.highlight_tracks()
 
@@ -208,7 +193,7 @@ class OfflineGame(GameScreen):
             else:
                 pygame.mouse.set_cursor(cursor)
 
-            pygame.display.flip()
+            cls.dirty_rects.present()
 
     @classmethod
     def is_my_turn(cls):
@@ -288,6 +273,10 @@ class LocalClientGame(GameScreen):
             buffer_size=config.NETWORK_BUFFER,
             local_color=GameManager.options.player_colors[Player.player1],
             online_color=GameManager.options.player_colors[Player.player2],
+            grace_period=config.SESSION_GRACE_PERIOD,
+            metrics_port=config.METRICS_PORT,
+            metrics_log_interval=config.METRICS_LOG_INTERVAL,
+            on_update=FrameScheduler.wake,
         )
         cls.online_state = cls.server.local_get_game_state()
         cls.online_state.current_turn = Player.other(cls.online_state.current_turn)
@@ -297,42 +286,38 @@ class LocalClientGame(GameScreen):
 
         cls.highlighted_indexes = []
 
+        cls.synced_version = -1
+
         cls.set_up_elements()
 
         cls.server.run_server()
 
         while cls.run:
-            clock.tick(config.FRAMERATE)
+            GameManager.frame_scheduler.tick()
             cursor = pygame.SYSTEM_CURSOR_ARROW
-            GraphicsManager.render_background(screen=screen)
 
             if cls.bot and time.time() - cls.bot_current_time > 1:
                 cls.move_bot(on_move=cls.on_bot_move)
 
-            cls.save_state(state=cls.server.local_get_game_state())
-            
-            cls.render_board(
-                is_online=True,
-                opponent_color=ColorConverter.pydantic_to_pygame(
-                    cls.online_state.online_color
-                ),
-            )
+            cls.sync_state()
 
             cls.update_game_buttons()
 
             cls.highlight_tracks(is_my_turn=cls.is_my_turn())
 
-            events = pygame.event.get()
+            events = GameManager.frame_scheduler.get_input()
 
             cls.check_quit(events=events, quit=cls.quit)
 
             cls.timer.update(events)
 
-            cls.render_elements(
+            cls.render_game(
                 screen=screen,
-                elements=cls.all_elements,
-                update_condition=not cls.is_screen_on_top(),
                 events=events,
+                is_online=True,
+                opponent_color=ColorConverter.pydantic_to_pygame(
+                    cls.online_state.online_color
+                ),
             )
 
             if not cls.is_screen_on_top():
@@ -357,7 +342,19 @@ class LocalClientGame(GameScreen):
             else:
                 pygame.mouse.set_cursor(cursor)
 
-            pygame.display.flip()
+            cls.dirty_rects.present()
+
+    @classmethod
+    def sync_state(cls):
+        """
+        Takes the server's state, but only when the game changed since the last sync.
+        """
+        cls.server.set_local_color(GameManager.options.player_colors[Player.player1])
+        version = cls.server.online_backgammon.version
+        if version == cls.synced_version or not cls.server.game_started:
+            return
+        cls.synced_version = version
+        cls.save_state(state=cls.server.local_get_game_state())
 
     @classmethod
     def save_state(cls, state: OnlineGameState):
@@ -378,8 +375,6 @@ class LocalClientGame(GameScreen):
             cls.play_piece_sound()
         
         cls.online_state = state
-        cls.server.set_local_color(GameManager.options.player_colors[Player.player1])
-
         cls.backgammon = Backgammon([state])
 
     @classmethod
@@ -490,6 +485,8 @@ class OnlineClientGame(GameScreen):
             port=config.GAME_PORT,
             buffer_size=config.NETWORK_BUFFER,
             timeout=cls.timeout,
+            reconnect_timeout=config.SESSION_GRACE_PERIOD,
+            on_session_update=cls.save_state,
         )
 
         cls.network_client.connect()
@@ -505,19 +502,11 @@ class OnlineClientGame(GameScreen):
         cls.game_time = time.time()
 
         while cls.run:
-            clock.tick(config.FRAMERATE)
-            screen.fill("black")
+            GameManager.frame_scheduler.tick()
             cursor = pygame.SYSTEM_CURSOR_ARROW
 
-            GraphicsManager.render_background(screen=screen)
-
             if cls.bot and time.time() - cls.bot_current_time > 1:
                 cls.move_bot(on_move=cls.on_bot_move)
-            
-            opponent_color = ColorConverter.pydantic_to_pygame(
-                cls.online_state.local_color
-            )
-            cls.render_board(is_online=True, opponent_color=opponent_color)
 
             if time.time() - cls.game_time > cls.refresh_frequency:
                 cls.game_time = time.time()
@@ -527,17 +516,19 @@ class OnlineClientGame(GameScreen):
             
             cls.highlight_tracks(is_my_turn=cls.is_my_turn())
 
-            events = pygame.event.get()
+            events = GameManager.frame_scheduler.get_input()
             
             cls.check_quit(events=events, quit=cls.quit)
 
             cls.timer.update(events)
 
-            cls.render_elements(
+            cls.render_game(
                 screen=screen,
-                elements=cls.all_elements,
                 events=events,
-                update_condition=not cls.is_screen_on_top(),
+                is_online=True,
+                opponent_color=ColorConverter.pydantic_to_pygame(
+                    cls.online_state.local_color
+                ),
             )
 
             if not cls.is_screen_on_top():
@@ -571,7 +562,7 @@ class OnlineClientGame(GameScreen):
             else:
                 pygame.mouse.set_cursor(cursor)
 
-            pygame.display.flip()
+            cls.dirty_rects.present()
 
     @classmethod
     def has_history(cls):
@@ -636,12 +627,32 @@ class OnlineClientGame(GameScreen):
             cls.options or not GameManager.is_window_focused() or cls.is_reconnecting()
         )
 
+    @classmethod
+    def schedule_wake(cls):
+        super().schedule_wake()
+        GameManager.frame_scheduler.wake_at(cls.game_time + cls.refresh_frequency)
+
+    @classmethod
+    def is_overlay_shown(cls):
+        return (
+            cls.is_screen_on_top()
+            or not cls.network_client.started
+            or not cls.network_client.connected
+        )
+
     @classmethod
     def is_reconnecting(cls):
-        return cls.network_client.time_from_last_receive > cls.timeout / 2
+        return (
+            cls.network_client.reconnecting
+            or cls.network_client.time_from_last_receive > cls.timeout / 2
+        )
 
     @classmethod
     def save_state(cls, state: OnlineGameState):
+        # polls return the same state until the game changes
+        if cls.started and state.sequence == cls.online_state.sequence:
+            return
+
         p1 = Player.player1
         p2 = Player.player2
 
@@ -659,6 +670,7 @@ class OnlineClientGame(GameScreen):
         cls.online_state = state
         cls.backgammon = Backgammon([state])
         cls.started = True
+        FrameScheduler.wake()
 
     @classmethod
     def send_color(cls):
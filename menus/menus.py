@@ -11,6 +11,7 @@ from graphics.graphics_manager import GraphicsManager, draw_border, gradient_sur
 from graphics.outline_text import OutlineText
 from graphics.elements import ButtonElement, SliderElement
 from graphics.styled_elements import StyledBetterButton, StyledButton, StyledSlider
+from input_snapshot import InputSnapshot
 from menus.screen import Screen
 import pygame
 
@@ -18,14 +19,39 @@ from models import ColorConverter, Player, Position
 
 
 class Menu(Screen):
-    """Rendered on top of another screen. Uses its events"""
+    """
+    Rendered on top of another screen. Uses its events.
+    The menu is drawn on GameManager.get_menu_surface, in the middle of the screen.
+    """
+
+    _backgrounds: dict[tuple[int, tuple[int, int]], pygame.Surface] = {}
+
+    @staticmethod
+    def get_background(alpha: int, size: tuple[int, int]) -> pygame.Surface:
+        """
+        Returns a shared translucent black surface that covers a screen of size.
+        """
+        background = Menu._backgrounds.get((alpha, size))
+        if background is None:
+            # the window was resized, the old backgrounds are not needed anymore
+            Menu._backgrounds = {
+                key: background
+                for key, background in Menu._backgrounds.items()
+                if key[1] == size
+            }
+            background = pygame.Surface(size=size, flags=pygame.SRCALPHA, depth=32)
+            background.fill(pygame.Color(0, 0, 0, alpha))
+            if pygame.display.get_surface() is not None:
+                background = background.convert_alpha()
+            Menu._backgrounds[(alpha, size)] = background
+        return background
 
     @classmethod
     def start(
         cls,
         screen: pygame.Surface,
         close: Callable[[], None],
-        events: list[pygame.event.Event],
+        events: InputSnapshot,
     ):
         pass
         raise NotImplementedError()
@@ -46,7 +72,7 @@ class OptionsMenu(Menu):
         OptionsMenu.blue_slider.value = current_color.b
 
     player_button = StyledBetterButton(
-        position=Position(coords=(config.SCREEN.centerx, 210)),
+        position=Position(coords=(config.MENU.centerx, 210)),
         font=get_font(24),
         text_input="player1",
         on_click=switch_player
@@ -70,11 +96,12 @@ class OptionsMenu(Menu):
         GameManager.options.player_colors[OptionsMenu.current_player] = (
             ColorConverter.pygame_to_pydantic(new_color)
         )
+        GraphicsManager.forget_piece_color(old_color)
     
     red_slider = StyledSlider(
         min_value=0,
         max_value=255,
-        position=Position(coords=(config.SCREEN.centerx, 250)),
+        position=Position(coords=(config.MENU.centerx, 250)),
         default_value=current_color.r,
         id="r",
         slider_surface=draw_border(
@@ -92,7 +119,7 @@ class OptionsMenu(Menu):
     green_slider = StyledSlider(
         min_value=0,
         max_value=255,
-        position=Position(coords=(config.SCREEN.centerx, 290)),
+        position=Position(coords=(config.MENU.centerx, 290)),
         default_value=current_color.g,
         id="g",
         slider_surface=draw_border(
@@ -110,7 +137,7 @@ class OptionsMenu(Menu):
     blue_slider = StyledSlider(
         min_value=0,
         max_value=255,
-        position=Position(coords=(config.SCREEN.centerx, 330)),
+        position=Position(coords=(config.MENU.centerx, 330)),
         default_value=current_color.b,
         id="b",
         slider_surface=draw_border(
@@ -127,8 +154,8 @@ class OptionsMenu(Menu):
     
     @staticmethod
     def get_volume_button_image():
-        return pygame.transform.scale(
-            config.MUTE_ICON if GameManager.sound_manager.volume == 0 else config.VOLUME_ICON,
+        return config.get_image(
+            "MUTE_ICON" if GameManager.sound_manager.volume == 0 else "VOLUME_ICON",
             (30, 30),
         )
 
@@ -141,6 +168,7 @@ class OptionsMenu(Menu):
         
         OptionsMenu.volume_slider.value = GameManager.sound_manager.volume
     
+    muted = GameManager.sound_manager.volume == 0
     volume_button = StyledBetterButton(
         position=Position(coords=(50, 50)),
         image=get_volume_button_image(),
@@ -157,7 +185,7 @@ class OptionsMenu(Menu):
         max_value=1,
         step=0.05,
         label=volume_button,
-        position=Position(coords=(config.SCREEN.centerx, 520)),
+        position=Position(coords=(config.MENU.centerx, 520)),
         default_value=GameManager.sound_manager.volume,
         label_position="top",
         id="volume",
@@ -165,7 +193,7 @@ class OptionsMenu(Menu):
     )
 
     back_button = StyledButton(
-        position=Position(coords=(config.SCREEN.centerx, 650)),
+        position=Position(coords=(config.MENU.centerx, 650)),
         text_input="BACK",
         font=get_font(50),
     )
@@ -176,7 +204,7 @@ class OptionsMenu(Menu):
         text_color=pygame.Color("white"),
         outline_color=pygame.Color("black"),
         outline_width=3,
-        position=Position(coords=(config.SCREEN.centerx, 70)),
+        position=Position(coords=(config.MENU.centerx, 70)),
     )
 
     elements: list[Element] = [
@@ -198,182 +226,164 @@ class OptionsMenu(Menu):
         cls,
         screen: pygame.Surface,
         close: Callable[[], None],
-        events: list[pygame.event.Event],
+        events: InputSnapshot,
         on_top=True,
     ) -> None:
         if on_top:
-            menu_surface = pygame.Surface(
-                size=config.RESOLUTION, flags=pygame.SRCALPHA, depth=32
+            screen.blit(
+                source=cls.get_background(alpha=200, size=screen.get_size()),
+                dest=(0, 0),
             )
-            menu_surface.convert_alpha()
-            menu_surface.fill(pygame.Color(0, 0, 0, 200))
-            screen.blit(source=menu_surface, dest=(0, 0))
 
         cls.back_button.on_click = close
-        cls.volume_button.image = cls.get_volume_button_image()
+        muted = GameManager.sound_manager.volume == 0
+        if muted != cls.muted:
+            cls.muted = muted
+            cls.volume_button.image = cls.get_volume_button_image()
         cls.player_button.on_click = cls.switch_player
 
+        menu = GameManager.get_menu_surface()
         GraphicsManager.render_piece(
-            screen,
-            center=(config.SCREEN.centerx, 400),
+            menu,
+            center=(config.MENU.centerx, 400),
             color=cls.get_current_color(),
             radius=35,
         )
 
-        cls.options_text.update(screen)
+        cls.options_text.update(menu)
+
+        with events.relative_to(menu) as events:
+            pygame.mouse.set_cursor(cls._get_cursor(elements=cls.elements))
+            cls.render_elements(screen=menu, elements=cls.elements, events=events)
+            cls.click_elements(elements=cls.elements, events=events)
 
-        pygame.mouse.set_cursor(cls._get_cursor(elements=cls.elements))
-        cls.render_elements(screen=screen, elements=cls.elements, events=events)
-        cls.click_elements(elements=cls.elements, events=events)
 
+class OverlayMenu(Menu):
+    """
+    Dims the screen under it and shows titles that never change.
+    The titles are rendered once, so a frame only blits the overlay and updates the elements.
+    """
 
-class ConnectingMenu(Menu):
+    titles: list[OutlineText] = []
+    elements: list[Element] = []
+    _overlay: list[tuple[pygame.Surface, pygame.Rect]] | None = None
 
     @classmethod
-    def start(cls, screen: pygame.Surface) -> None:
-        menu_surface = pygame.Surface(
-            size=config.RESOLUTION, flags=pygame.SRCALPHA, depth=32
-        )
-        menu_surface.convert_alpha()
-        menu_surface.fill(pygame.Color(0, 0, 0, 180))
-        screen.blit(source=menu_surface, dest=(0, 0))
-
-        OutlineText.render(
-            text="CONNECTING...",
-            font=get_font(100),
-            text_color=pygame.Color("white"),
-            outline_color=pygame.Color("black"),
-            outline_width=3,
-            surface=screen,
-            position=Position(coords=(config.SCREEN.centerx, 300)),
-        )
+    def get_overlay(cls) -> list[tuple[pygame.Surface, pygame.Rect]]:
+        """
+        Returns the titles, placed on the menu surface.
+        """
+        if cls._overlay is None:
+            cls._overlay = []
+            for title in cls.titles:
+                surface = OutlineText.get_surface(
+                    text=title.text,
+                    font=title.font,
+                    text_color=title.text_color,
+                    outline_color=title.outline_color,
+                    outline_width=title.outline_width,
+                )
+                cls._overlay.append((surface, surface.get_rect(**title.position.dump())))
+        return cls._overlay
 
-        pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_ARROW)
+    @classmethod
+    def render_overlay(cls, screen: pygame.Surface) -> None:
+        screen.blit(cls.get_background(alpha=180, size=screen.get_size()), (0, 0))
+        GameManager.get_menu_surface().blits(cls.get_overlay(), doreturn=False)
 
+    @classmethod
+    def update_elements(
+        cls, screen: pygame.Surface, events: InputSnapshot
+    ) -> None:
+        menu = GameManager.get_menu_surface()
+        with events.relative_to(menu) as events:
+            cls.render_elements(screen=menu, elements=cls.elements, events=events)
+            pygame.mouse.set_cursor(cls._get_cursor(elements=cls.elements))
+            cls.click_elements(elements=cls.elements, events=events)
 
-class UnfocusedMenu(Menu):
+
+def create_title(text: str, size: int, y: int) -> OutlineText:
+    return OutlineText(
+        text=text,
+        font=get_font(size),
+        text_color=pygame.Color("white"),
+        outline_color=pygame.Color("black"),
+        outline_width=3,
+        position=Position(coords=(config.MENU.centerx, y)),
+    )
+
+
+def create_leave_button() -> BetterButtonElement:
+    return BetterButtonElement(
+        position=Position(coords=(config.MENU.centerx, 650)),
+        text_input="LEAVE",
+        font=get_font(50),
+        base_color=config.BUTTON_COLOR,
+        hovering_color=config.BUTTON_HOVER_COLOR,
+    )
+
+
+class ConnectingMenu(OverlayMenu):
+
+    titles = [create_title(text="CONNECTING...", size=100, y=300)]
 
     @classmethod
     def start(cls, screen: pygame.Surface) -> None:
-        menu_surface = pygame.Surface(
-            size=config.RESOLUTION, flags=pygame.SRCALPHA, depth=32
-        )
-        menu_surface.convert_alpha()
-        menu_surface.fill(pygame.Color(0, 0, 0, 180))
-        screen.blit(source=menu_surface, dest=(0, 0))
-
-        OutlineText.render(
-            surface=screen,
-            text="UNFOCUSED...",
-            font=get_font(100),
-            text_color=pygame.Color("white"),
-            outline_color=pygame.Color("black"),
-            outline_width=3,
-            position=Position(
-                coords=(config.SCREEN.centerx, round(config.RESOLUTION[1] / 2.5))
-            ),
+        cls.render_overlay(screen)
+        pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_ARROW)
+
+
+class UnfocusedMenu(OverlayMenu):
+
+    titles = [
+        create_title(
+            text="UNFOCUSED...", size=100, y=round(config.MENU.height / 2.5)
         )
+    ]
 
+    @classmethod
+    def start(cls, screen: pygame.Surface) -> None:
+        cls.render_overlay(screen)
         pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_ARROW)
 
 
-class WaitingMenu(Menu):
+class WaitingMenu(OverlayMenu):
+
+    titles = [
+        create_title(text="PLAYER 2 NOT CONNECTED", size=60, y=200),
+        create_title(text="WATING", size=80, y=400),
+    ]
+    leave_button = create_leave_button()
+    elements = [leave_button]
 
     @classmethod
     def start(
         cls,
         screen: pygame.Surface,
         close: Callable[[], None],
-        events: list[pygame.event.Event],
+        events: InputSnapshot,
     ):
-        menu_surface = pygame.Surface(
-            size=config.RESOLUTION, flags=pygame.SRCALPHA, depth=32
-        )
-        menu_surface.convert_alpha()
-        menu_surface.fill(pygame.Color(0, 0, 0, 180))
-        screen.blit(source=menu_surface, dest=(0, 0))
-
-        OutlineText.render(
-            text="PLAYER 2 NOT CONNECTED",
-            font=get_font(60),
-            text_color=pygame.Color("white"),
-            outline_color=pygame.Color("black"),
-            outline_width=3,
-            position=Position(coords=(config.SCREEN.centerx, 200)),
-            surface=screen,
-        )
+        cls.leave_button.on_click = close
+        cls.render_overlay(screen)
+        cls.update_elements(screen=screen, events=events)
 
-        OutlineText.render(
-            text="WATING",
-            font=get_font(80),
-            text_color=pygame.Color("white"),
-            outline_color=pygame.Color("black"),
-            outline_width=3,
-            position=Position(coords=(config.SCREEN.centerx, 400)),
-            surface=screen,
-        )
 
-        leave_button = BetterButtonElement(
-            position=Position(coords=(config.SCREEN.centerx, 650)),
-            text_input="LEAVE",
-            font=get_font(50),
-            base_color=config.BUTTON_COLOR,
-            hovering_color=config.BUTTON_HOVER_COLOR,
-            on_click=close,
-        )
+class LostConnectionMenu(OverlayMenu):
 
-        cls.render_elements(screen=screen, elements=[leave_button], events=events)
-        pygame.mouse.set_cursor(cls._get_cursor(elements=[leave_button]))
-
-        cls.click_elements(elements=[leave_button], events=events)
-
-
-class LostConnectionMenu(Menu):
+    titles = [
+        create_title(text="LOST CONNECTION", size=80, y=300),
+        create_title(text="TO THE SERVER", size=80, y=400),
+    ]
+    leave_button = create_leave_button()
+    elements = [leave_button]
 
     @classmethod
     def start(
         cls,
         screen: pygame.Surface,
         close: Callable[[], None],
-        events: list[pygame.event.Event],
+        events: InputSnapshot,
     ):
-        menu_surface = pygame.Surface(
-            size=config.RESOLUTION, flags=pygame.SRCALPHA, depth=32
-        )
-        menu_surface.convert_alpha()
-        menu_surface.fill(pygame.Color(0, 0, 0, 180))
-        screen.blit(source=menu_surface, dest=(0, 0))
-
-        OutlineText.render(
-            text="LOST CONNECTION",
-            font=get_font(80),
-            text_color=pygame.Color("white"),
-            outline_color=pygame.Color("black"),
-            outline_width=3,
-            position=Position(coords=(config.SCREEN.centerx, 300)),
-            surface=screen,
-        )
-
-        OutlineText.render(
-            text="TO THE SERVER",
-            font=get_font(80),
-            text_color=pygame.Color("white"),
-            outline_color=pygame.Color("black"),
-            outline_width=3,
-            position=Position(coords=(config.SCREEN.centerx, 400)),
-            surface=screen,
-        )
-
-        leave_button = BetterButtonElement(
-            position=Position(coords=(config.SCREEN.centerx, 650)),
-            text_input="LEAVE",
-            font=get_font(50),
-            base_color=config.BUTTON_COLOR,
-            hovering_color=config.BUTTON_HOVER_COLOR,
-            on_click=close,
-        )
-
-        cls.render_elements(screen=screen, elements=[leave_button], events=events)
-        pygame.mouse.set_cursor(cls._get_cursor(elements=[leave_button]))
-
-        cls.click_elements(elements=[leave_button], events=events)
+        cls.leave_button.on_click = close
+        cls.render_overlay(screen)
+        cls.update_elements(screen=screen, events=events)
@@ -6,12 +6,14 @@ import config
 from config import get_font
 from decorators import debounce
 from game_manager import GameManager
+from graphics.dirty_rects import DirtyRects
 from graphics.elements import ButtonElement, Element, TimerElement
 import pygame
 from typing import Callable
 from graphics.graphics_manager import GraphicsManager
 from graphics.styled_elements import StyledButton
-from models import ColorConverter, Move, Player, Position, ScoredMoves
+from input_snapshot import InputSnapshot
+from models import ColorConverter, GameState, Move, Player, Position, ScoredMoves
 
 
 class Screen:
@@ -25,7 +27,7 @@ class Screen:
         cls,
         screen: pygame.Surface,
         elements: list[Element],
-        events: list[pygame.event.Event],
+        events: InputSnapshot,
         update_condition=True,
     ):
         for element in elements:
@@ -40,7 +42,7 @@ class Screen:
         return pygame.SYSTEM_CURSOR_ARROW
 
     @classmethod
-    def click_elements(cls, elements: list[Element], events: list[pygame.event.Event]):
+    def click_elements(cls, elements: list[Element], events: InputSnapshot):
         clicked = False
         for element in elements:
             clicked = element.click(events)
@@ -48,8 +50,8 @@ class Screen:
                 break
 
     @classmethod
-    def check_quit(cls, events: list[pygame.event.Event], quit: Callable[[], None]):
-        if any(event.type == pygame.QUIT for event in events):
+    def check_quit(cls, events: InputSnapshot, quit: Callable[[], None]):
+        if events.quit:
             quit()
 
 
@@ -100,6 +102,8 @@ class GameScreen(Screen):
     run = True
     options = False
     graphics: GraphicsManager
+    dirty_rects: DirtyRects
+    _game_state: tuple[int, GameState | None] = (-1, None)
     last_clicked_index = -1
     highlighted_indexes: list[int] = []
 
@@ -135,11 +139,8 @@ class GameScreen(Screen):
         return pygame.SYSTEM_CURSOR_ARROW
 
     @classmethod
-    def move_piece(cls, events: list[pygame.event.Event]):
-        if not any(
-            event.type == pygame.MOUSEBUTTONDOWN and event.button == 1
-            for event in events
-        ):
+    def move_piece(cls, events: InputSnapshot):
+        if not events.clicked:
             return
 
         index = cls.graphics.check_track_input()
@@ -169,32 +170,40 @@ class GameScreen(Screen):
 
     @classmethod
     def set_up_elements(cls):
-        right_center = math.floor((cls.graphics.RECT.right + config.RESOLUTION[0]) / 2)
-        left_center = math.floor(cls.graphics.RECT.left / 2)
+        cls.dirty_rects = DirtyRects()
+        cls.layout_elements()
 
         cls.done_button.disabled = True
-        cls.done_button.position = Position(
-            anchor="midbottom", coords=(right_center, config.SCREEN.centery)
-        )
         cls.done_button.on_click = cls.done_turn
-
-        cls.leave_button.position = Position(
-            coords=(left_center, config.SCREEN.centery)
-        )
         cls.leave_button.on_click = cls.stop
+        cls.options_button.on_click = cls.open_options
+        cls.undo_button.on_click = cls.undo_move
+        cls.timer.on_done = cls.setup_bot
+
+    @classmethod
+    def layout_elements(cls):
+        """
+        Places the elements beside the board. Called again when the window is resized,
+        so it only moves them and redraws the whole screen.
+        """
+        cls.dirty_rects.invalidate()
+        rect = cls.graphics.RECT
+        right_center = math.floor((rect.right + config.RESOLUTION[0]) / 2)
+        left_center = math.floor(rect.left / 2)
 
+        cls.done_button.position = Position(
+            anchor="midbottom", coords=(right_center, rect.centery)
+        )
+        cls.leave_button.position = Position(coords=(left_center, rect.centery))
         cls.options_button.position = Position(
             anchor="topright", coords=(config.SCREEN.width - 12, 12)
         )
-        cls.options_button.on_click = cls.open_options
-
         cls.undo_button.position = Position(
-            anchor="midtop", coords=(right_center, config.SCREEN.centery)
+            anchor="midtop", coords=(right_center, rect.centery)
+        )
+        cls.timer.position = Position(
+            coords=(right_center, cls.graphics.scale_text_y(200))
         )
-        cls.undo_button.on_click = cls.undo_move
-
-        cls.timer.position = Position(coords=(right_center, 200))
-        cls.timer.on_done = cls.setup_bot
 
     @classmethod
     def start_timer(cls):
@@ -304,8 +313,103 @@ class GameScreen(Screen):
         raise NotImplementedError
 
     @classmethod
-    def render_board(cls, is_online=True, opponent_color: pygame.Color | None = None):
-        player_colors = {
+    def is_overlay_shown(cls) -> bool:
+        """
+        Whether a menu is drawn over the game this frame.
+        """
+        return cls.is_screen_on_top()
+
+    @classmethod
+    def render_game(
+        cls,
+        screen: pygame.Surface,
+        events: InputSnapshot,
+        is_online=True,
+        opponent_color: pygame.Color | None = None,
+    ):
+        """
+        Renders the board, the texts and the elements. Only the regions that changed
+        since the last frame are redrawn; present them with cls.dirty_rects.present().
+        """
+        if cls.graphics.resize():
+            cls.layout_elements()
+        cls.graphics.update_hovered_track(events.mouse_position)
+
+        if not cls.is_screen_on_top():
+            for element in cls.all_elements:
+                element.update(events)
+
+        cls.dirty_rects.begin_frame(overlay=cls.is_overlay_shown())
+        player_colors = cls.get_player_colors(opponent_color=opponent_color)
+        version = cls.backgammon.version
+        graphics = cls.graphics
+
+        board_signature = graphics.get_board_signature(
+            version=version, player_colors=player_colors
+        )
+        if cls.dirty_rects.is_dirty(
+            key="board", rects=[graphics.RECT], signature=board_signature
+        ):
+            graphics.render_board_surface(
+                game_state=cls.get_game_state(),
+                player_colors=player_colors,
+                signature=board_signature,
+            )
+
+        if cls.dirty_rects.is_dirty(
+            key="sides",
+            rects=graphics.SIDE_RECTS,
+            signature=(
+                graphics.get_info_signature(
+                    version=version,
+                    player_colors=player_colors,
+                    is_online=is_online,
+                ),
+                tuple(element.get_signature() for element in cls.all_elements),
+            ),
+        ):
+            background = graphics.get_background(screen.get_size())
+            for rect in graphics.SIDE_RECTS:
+                screen.blit(source=background, dest=rect, area=rect)
+            graphics.render_info(
+                game_state=cls.get_game_state(),
+                player_colors=player_colors,
+                is_online=is_online,
+            )
+            for element in cls.all_elements:
+                element.render(screen)
+
+        cls.schedule_wake()
+
+    @classmethod
+    def schedule_wake(cls):
+        """
+        Sets deadlines for the changes that come with time rather than with events,
+        so they are rendered on time while the frame scheduler is idle.
+        """
+        scheduler = GameManager.frame_scheduler
+        if cls.bot:
+            scheduler.wake_at(cls.bot_current_time + 1)
+        next_change = cls.timer.get_next_change()
+        if next_change is not None:
+            scheduler.wake_at(next_change)
+
+    @classmethod
+    def get_game_state(cls) -> GameState:
+        """
+        Backgammon.state is a deep copy, so the copy is kept until the game changes.
+        """
+        version, game_state = cls._game_state
+        if version != cls.backgammon.version:
+            game_state = cls.backgammon.state
+            cls._game_state = (cls.backgammon.version, game_state)
+        return game_state
+
+    @classmethod
+    def get_player_colors(
+        cls, opponent_color: pygame.Color | None = None
+    ) -> dict[Player, pygame.Color]:
+        return {
             Player.player1: ColorConverter.pydantic_to_pygame(
                 GameManager.options.player_colors[Player.player1]
             ),
@@ -317,8 +421,12 @@ class GameScreen(Screen):
                 else opponent_color
             ),
         }
+
+    @classmethod
+    def render_board(cls, is_online=True, opponent_color: pygame.Color | None = None):
+        player_colors = cls.get_player_colors(opponent_color=opponent_color)
         cls.graphics.render_board(
-            game_state=cls.backgammon.state,
+            game_state=cls.get_game_state(),
             player_colors=player_colors,
             is_online=is_online,
         )
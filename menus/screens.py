@@ -26,7 +26,7 @@ class LostConnection(Screen):
             font=get_font(100),
             text_color=pygame.Color("white"),
             outline_color=pygame.Color("black"),
-            position=Position(coords=(config.SCREEN.centerx, 200)),
+            position=Position(coords=(config.MENU.centerx, 200)),
         )
         
         to_the_server = OutlineText(
@@ -34,7 +34,7 @@ class LostConnection(Screen):
             font=get_font(100),
             text_color=pygame.Color("white"),
             outline_color=pygame.Color("black"),
-            position=Position(coords=(config.SCREEN.centerx, 300)),
+            position=Position(coords=(config.MENU.centerx, 300)),
         )
         
 
@@ -43,7 +43,7 @@ class LostConnection(Screen):
             run = False
 
         back_button = StyledButton(
-            position=Position(coords=(config.SCREEN.centerx, 650)),
+            position=Position(coords=(config.MENU.centerx, 650)),
             text_input="BACK",
             font=get_font(50),
             on_click=back_click,
@@ -52,19 +52,22 @@ class LostConnection(Screen):
         buttons = [back_button]
 
         while run:
-            GraphicsManager.render_background(screen)
-            clock.tick(config.FRAMERATE)
+            GameManager.frame_scheduler.tick()
 
-            lost_connection.update(screen)
-            to_the_server.update(screen)
-            
-            cls.render_elements(screen=screen, elements=buttons)
-            pygame.mouse.set_cursor(cls._get_cursor(elements=buttons))
-            
-            events = pygame.event.get()
+            events = GameManager.frame_scheduler.get_input()
             
             cls.check_quit(events=events, quit=GameManager.quit)
-            cls.click_elements(elements=buttons, events=events)
+
+            GraphicsManager.render_background(screen)
+            menu = GameManager.get_menu_surface()
+
+            lost_connection.update(menu)
+            to_the_server.update(menu)
+            
+            with events.relative_to(menu) as events:
+                cls.render_elements(screen=menu, elements=buttons, events=events)
+                pygame.mouse.set_cursor(cls._get_cursor(elements=buttons))
+                cls.click_elements(elements=buttons, events=events)
 
             pygame.display.flip()
 
@@ -89,14 +92,14 @@ class JoinRoomScreen(Screen):
             back_click()
 
         join_button = StyledBetterButton(
-            position=Position(coords=(config.SCREEN.centerx, 500)),
+            position=Position(coords=(config.MENU.centerx, 500)),
             text_input="JOIN",
             font=get_font(70),
             on_click=join_click,
         )
 
         back_button = StyledButton(
-            position=Position(coords=(config.SCREEN.centerx, 650)),
+            position=Position(coords=(config.MENU.centerx, 650)),
             text_input="BACK",
             font=get_font(50),
             on_click=back_click,
@@ -108,7 +111,7 @@ class JoinRoomScreen(Screen):
         
         ip_field = StyledTextField(
             font=get_font(60),
-            position=Position(coords=(config.SCREEN.centerx, 300)),
+            position=Position(coords=(config.MENU.centerx, 300)),
             width=500,
             default=ip_address,
             on_value_changed=set_ip,
@@ -121,28 +124,29 @@ class JoinRoomScreen(Screen):
             font=get_font(80),
             text_color=pygame.Color("white"),
             outline_color=pygame.Color("black"),
-            position=Position(coords=(config.SCREEN.centerx, 100)),
+            position=Position(coords=(config.MENU.centerx, 100)),
         )
         
         elements: list[Element] = [back_button, join_button, ip_field]
 
         while run:
 
-            clock.tick(config.FRAMERATE)
+            GameManager.frame_scheduler.tick()
 
             join_button.disabled=not cls._is_valid_ip(ip_address)
             
-            GraphicsManager.render_background(screen)
-            
-            menu_text.update(screen)
-            
-            events = pygame.event.get()
+            events = GameManager.frame_scheduler.get_input()
             cls.check_quit(events=events, quit=GameManager.quit)
             
-            cls.render_elements(screen=screen, elements=elements, events=events)
-            pygame.mouse.set_cursor(cls._get_cursor(elements=elements))
+            GraphicsManager.render_background(screen)
+            menu = GameManager.get_menu_surface()
+            
+            menu_text.update(menu)
             
-            cls.click_elements(elements=elements, events=events)
+            with events.relative_to(menu) as events:
+                cls.render_elements(screen=menu, elements=elements, events=events)
+                pygame.mouse.set_cursor(cls._get_cursor(elements=elements))
+                cls.click_elements(elements=elements, events=events)
 
             pygame.display.flip()
             
@@ -173,21 +177,21 @@ class OnlineScreen(Screen):
             back_click()
 
         join_room_button = StyledBetterButton(
-            position=Position(coords=(config.SCREEN.centerx, 270)),
+            position=Position(coords=(config.MENU.centerx, 270)),
             text_input="JOIN ROOM",
             font=get_font(70),
             on_click=join_room_click,
         )
 
         create_room_button = StyledBetterButton(
-            position=Position(coords=(config.SCREEN.centerx, 420)),
+            position=Position(coords=(config.MENU.centerx, 420)),
             text_input="CREATE ROOM",
             font=get_font(70),
             on_click=create_room_click,
         )
 
         back_button = StyledButton(
-            position=Position(coords=(config.SCREEN.centerx, 650)),
+            position=Position(coords=(config.MENU.centerx, 650)),
             text_input="BACK",
             font=get_font(50),
             on_click=back_click,
@@ -197,19 +201,19 @@ class OnlineScreen(Screen):
 
         while run:
 
-            clock.tick(config.FRAMERATE)
-            screen.fill("black")
+            GameManager.frame_scheduler.tick()
 
-            GraphicsManager.render_background(screen)
-
-            events = pygame.event.get()
+            events = GameManager.frame_scheduler.get_input()
             
             cls.check_quit(events=events, quit=GameManager.quit)
-            
-            cls.render_elements(screen=screen, elements=buttons, events=events)
-            pygame.mouse.set_cursor(cls._get_cursor(elements=buttons))
 
-            cls.click_elements(elements=buttons, events=events)
+            GraphicsManager.render_background(screen)
+            menu = GameManager.get_menu_surface()
+            
+            with events.relative_to(menu) as events:
+                cls.render_elements(screen=menu, elements=buttons, events=events)
+                pygame.mouse.set_cursor(cls._get_cursor(elements=buttons))
+                cls.click_elements(elements=buttons, events=events)
 
             pygame.display.flip()
 
@@ -238,28 +242,28 @@ class PlayScreen(Screen):
             OnlineScreen.start(screen, clock)
 
         online_button = StyledBetterButton(
-            position=Position(coords=(config.SCREEN.centerx, 180)),
+            position=Position(coords=(config.MENU.centerx, 180)),
             text_input="ON LAN",
             font=get_font(75),
             on_click=online_button_click,
         )
 
         bot_button = StyledBetterButton(
-            position=Position(coords=(config.SCREEN.centerx, 330)),
+            position=Position(coords=(config.MENU.centerx, 330)),
             text_input="AGAINST BOT",
             font=get_font(75),
             on_click=bot_button_click,
         )
 
         offline_button = StyledBetterButton(
-            position=Position(coords=(config.SCREEN.centerx, 480)),
+            position=Position(coords=(config.MENU.centerx, 480)),
             text_input="1v1",
             font=get_font(75),
             on_click=offline_button_click,
         )
 
         back_button = StyledButton(
-            position=Position(coords=(config.SCREEN.centerx, 650)),
+            position=Position(coords=(config.MENU.centerx, 650)),
             text_input="BACK",
             font=get_font(50),
             on_click=back_button_click,
@@ -268,16 +272,17 @@ class PlayScreen(Screen):
         buttons = [online_button, bot_button, offline_button, back_button]
 
         while run:
-            screen.fill("black")
-            GraphicsManager.render_background(screen=screen)
-            clock.tick(config.FRAMERATE)
+            GameManager.frame_scheduler.tick()
 
-            events = pygame.event.get()
+            events = GameManager.frame_scheduler.get_input()
             cls.check_quit(events=events, quit=GameManager.quit)
-            cls.render_elements(screen=screen, elements=buttons, events=events)
-            pygame.mouse.set_cursor(cls._get_cursor(elements=buttons))
 
-            cls.click_elements(elements=buttons, events=events)
+            GraphicsManager.render_background(screen=screen)
+            menu = GameManager.get_menu_surface()
+            with events.relative_to(menu) as events:
+                cls.render_elements(screen=menu, elements=buttons, events=events)
+                pygame.mouse.set_cursor(cls._get_cursor(elements=buttons))
+                cls.click_elements(elements=buttons, events=events)
 
             pygame.display.flip()
 
@@ -293,11 +298,11 @@ class OptionsScreen(Screen):
             run = False
         
         while run:
-            events = pygame.event.get()
+            GameManager.frame_scheduler.tick()
+            events = GameManager.frame_scheduler.get_input()
             cls.check_quit(events=events, quit=GameManager.quit)
             
             GraphicsManager.render_background(screen=screen)
-            clock.tick(config.FRAMERATE)
             OptionsMenu.start(screen=screen, on_top=False, close=close, events=events)
             pygame.display.flip()
 
@@ -320,25 +325,25 @@ class MainScreen(Screen):
             font=get_font(100),
             text_color=pygame.Color("white"),
             outline_color=pygame.Color("black"),
-            position=Position(coords=(config.SCREEN.centerx, 100)),
+            position=Position(coords=(config.MENU.centerx, 100)),
         )
 
         play_button = StyledBetterButton(
-            position=Position(coords=(config.SCREEN.centerx, 300)),
+            position=Position(coords=(config.MENU.centerx, 300)),
             text_input="PLAY",
             font=get_font(75),
             on_click=play_button_click,
         )
 
         options_button = StyledBetterButton(
-            position=Position(coords=(config.SCREEN.centerx, 450)),
+            position=Position(coords=(config.MENU.centerx, 450)),
             text_input="OPTIONS",
             font=get_font(75),
             on_click=options_button_click,
         )
 
         quit_button = StyledButton(
-            position=Position(coords=(config.SCREEN.centerx, 650)),
+            position=Position(coords=(config.MENU.centerx, 650)),
             text_input="QUIT",
             font=get_font(50),
             on_click=quit_button_click,
@@ -346,21 +351,20 @@ class MainScreen(Screen):
 
         buttons = [play_button, options_button, quit_button]
         while True:
-            clock.tick(config.FRAMERATE)
+            GameManager.frame_scheduler.tick()
 
-            screen.fill("black")
+            events = GameManager.frame_scheduler.get_input()
+            cls.check_quit(events=events, quit=GameManager.quit)
 
             GraphicsManager.render_background(screen=screen)
+            menu = GameManager.get_menu_surface()
 
-            main_menu.update(screen)
-
-            events = pygame.event.get()
-            cls.check_quit(events=events, quit=GameManager.quit)
+            main_menu.update(menu)
             
-            cls.render_elements(screen=screen, elements=buttons, events=events)
-            pygame.mouse.set_cursor(cls._get_cursor(elements=buttons))
-
-            cls.click_elements(elements=buttons, events=events)
+            with events.relative_to(menu) as events:
+                cls.render_elements(screen=menu, elements=buttons, events=events)
+                pygame.mouse.set_cursor(cls._get_cursor(elements=buttons))
+                cls.click_elements(elements=buttons, events=events)
         
             pygame.display.flip()
             
\ No newline at end of file
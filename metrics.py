@@ -0,0 +1,168 @@
+import asyncio
+import json
+import logging
+from threading import Lock
+import time
+
+logger = logging.getLogger(__name__)
+
+type Labels = dict[str, str]
+
+
+def _get_key(name: str, labels: Labels | None) -> str:
+    if not labels:
+        return name
+    label_text = ",".join(f'{key}="{value}"' for key, value in sorted(labels.items()))
+    return f"{name}{{{label_text}}}"
+
+
+class Histogram:
+    BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5)
+
+    def __init__(self) -> None:
+        self.bucket_counts = [0] * len(self.BUCKETS)
+        self.count = 0
+        self.sum: float = 0
+
+    def observe(self, value: float) -> None:
+        self.count += 1
+        self.sum += value
+        for index, bound in enumerate(self.BUCKETS):
+            if value <= bound:
+                self.bucket_counts[index] += 1
+                return
+
+    def dump(self) -> dict:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "buckets": dict(zip(map(str, self.BUCKETS), self.bucket_counts)),
+        }
+
+
+class MetricsRegistry:
+    """
+    Counters, gauges and latency histograms of a single server.
+    Safe to update from any thread.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._counters: dict[str, float] = {}
+        self._gauges: dict[str, float] = {}
+        self._histograms: dict[str, Histogram] = {}
+
+    def increment(self, name: str, value: float = 1, labels: Labels | None = None):
+        key = _get_key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def set_gauge(self, name: str, value: float, labels: Labels | None = None):
+        key = _get_key(name, labels)
+        with self._lock:
+            self._gauges[key] = value
+
+    def observe(self, name: str, value: float, labels: Labels | None = None):
+        key = _get_key(name, labels)
+        with self._lock:
+            if key not in self._histograms:
+                self._histograms[key] = Histogram()
+            self._histograms[key].observe(value)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "counters": dict(self._counters),
+                "gauges": dict(self._gauges),
+                "histograms": {
+                    key: histogram.dump() for key, histogram in self._histograms.items()
+                },
+            }
+
+    def render_text(self) -> str:
+        """
+        Renders the metrics in the Prometheus text format.
+        """
+        lines: list[str] = []
+        with self._lock:
+            for key, value in sorted({**self._counters, **self._gauges}.items()):
+                lines.append(f"{key} {value:g}")
+
+            for key, histogram in sorted(self._histograms.items()):
+                name, _, labels = key.partition("{")
+                labels = labels.rstrip("}")
+                separator = "," if labels else ""
+                cumulative = 0
+                for bound, count in zip(histogram.BUCKETS, histogram.bucket_counts):
+                    cumulative += count
+                    lines.append(
+                        f'{name}_bucket{{{labels}{separator}le="{bound}"}} {cumulative}'
+                    )
+                lines.append(
+                    f'{name}_bucket{{{labels}{separator}le="+Inf"}} {histogram.count}'
+                )
+                suffix = f"{{{labels}}}" if labels else ""
+                lines.append(f"{name}_sum{suffix} {histogram.sum:g}")
+                lines.append(f"{name}_count{suffix} {histogram.count}")
+
+        return "\n".join(lines) + "\n"
+
+
+class Timer:
+    """
+    Context manager that records the time spent in its block into a histogram.
+    """
+
+    def __init__(
+        self, metrics: MetricsRegistry, name: str, labels: Labels | None = None
+    ) -> None:
+        self._metrics = metrics
+        self._name = name
+        self.labels = labels
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._metrics.observe(
+            self._name, time.perf_counter() - self._start, labels=self.labels
+        )
+
+
+async def serve_metrics(metrics: MetricsRegistry, host: str, port: int) -> asyncio.Server:
+    """
+    Serves the metrics as plain text over HTTP. Any path returns the full registry.
+    """
+
+    async def handle_request(
+        reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ):
+        try:
+            await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), timeout=5)
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, TimeoutError):
+            pass
+        body = metrics.render_text().encode()
+        writer.write(
+            b"HTTP/1.1 200 OK\r\n"
+            b"Content-Type: text/plain; version=0.0.4\r\n"
+            + f"Content-Length: {len(body)}\r\n".encode()
+            + b"Connection: close\r\n\r\n"
+            + body
+        )
+        await writer.drain()
+        writer.close()
+        await writer.wait_closed()
+
+    server = await asyncio.start_server(handle_request, host=host, port=port)
+    logger.info("Serving metrics on http://%s:%d/metrics", host, port)
+    return server
+
+
+async def log_metrics(metrics: MetricsRegistry, interval: float) -> None:
+    """
+    Logs a JSON snapshot of the metrics every interval seconds.
+    """
+    while True:
+        await asyncio.sleep(interval)
+        logger.info(json.dumps(metrics.snapshot()))
@@ -53,6 +53,23 @@ class OnlineGameState(GameState):
     history_length: int
     online_color: PydanticColor
     local_color: PydanticColor
+    sequence: int = 0
+
+
+class SessionRequest(BaseModel):
+    """
+    First message of every connection. A client that lost its connection sends back
+    its token and the sequence of the last state it received to resume the game.
+    """
+
+    token: str | None = None
+    last_sequence: int = -1
+    spectator: bool = False
+
+
+class SessionResponse(BaseModel):
+    token: str
+    updates: list[OnlineGameState]
 
 
 class MoveType(StrEnum):
@@ -77,6 +94,7 @@ class ServerFlags(StrEnum):
     get_current_state = auto()
     done = auto()
     undo = auto()
+    keepalive = auto()
 
 
 class Position(BaseModel):
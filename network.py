@@ -1,7 +1,12 @@
+from collections import deque
 import ipaddress
+import logging
 from queue import Queue, Empty as EmptyQueueError
+import random
+import secrets
 import socket
-from threading import Thread
+import struct
+from threading import RLock, Thread
 from typing import Callable, Any
 import pickle
 import time
@@ -9,11 +14,96 @@ import time
 import psutil
 from backgammon import OnlineBackgammon, Backgammon
 from decorators import run_threaded
-from models import OnlineGameState, ServerFlags
+from metrics import MetricsRegistry, Timer, log_metrics, serve_metrics
+from models import OnlineGameState, ServerFlags, SessionRequest, SessionResponse
 from models import Move
 from pydantic_extra_types.color import Color
 import asyncio
 
+logger = logging.getLogger(__name__)
+
+# Every message is a pickled object prefixed by its length.
+HEADER = struct.Struct("!I")
+# a state is under 1KB and a session response carries at most updates_log_size of
+# them, so anything larger is refused before it is read
+MAX_FRAME_SIZE = 256 * 1024
+# spectators only send keepalives, well within the server's timeout
+KEEPALIVE_INTERVAL = 3
+
+
+def encode_message(data) -> bytes:
+    payload = pickle.dumps(data)
+    return HEADER.pack(len(payload)) + payload
+
+
+async def send_message(writer: asyncio.StreamWriter, data) -> None:
+    writer.write(encode_message(data))
+    await writer.drain()
+
+
+async def receive_frame(reader: asyncio.StreamReader) -> bytes:
+    """
+    Reads the payload of a single message. Raises asyncio.IncompleteReadError if the
+    connection was closed, and ValueError if the message is larger than MAX_FRAME_SIZE.
+    """
+    header = await reader.readexactly(HEADER.size)
+    (size,) = HEADER.unpack(header)
+    if size > MAX_FRAME_SIZE:
+        raise ValueError(f"frame of {size} bytes is larger than {MAX_FRAME_SIZE}")
+    return await reader.readexactly(size)
+
+
+async def receive_message(reader: asyncio.StreamReader):
+    return pickle.loads(await receive_frame(reader))
+
+
+async def send_keepalives(writer: asyncio.StreamWriter) -> None:
+    """
+    Keeps a spectator's connection open, the server drops spectators that stay silent.
+    """
+    while True:
+        await asyncio.sleep(KEEPALIVE_INTERVAL)
+        await send_message(writer=writer, data=ServerFlags.keepalive)
+
+
+def get_message_type(message) -> str:
+    return str(message) if isinstance(message, ServerFlags) else type(message).__name__
+
+
+class Spectator:
+    """
+    A read-only connection. Frames are written by the spectator's own task, so a slow
+    spectator never stalls the players. When it falls behind, its oldest frames are dropped.
+    """
+
+    def __init__(
+        self, writer: asyncio.StreamWriter, address: str, max_pending_frames: int = 4
+    ) -> None:
+        self.writer = writer
+        self.address = address
+        self._frames: asyncio.Queue[bytes] = asyncio.Queue(maxsize=max_pending_frames)
+        self.dropped_frames = 0
+
+    def push(self, frame: bytes) -> bool:
+        """
+        Returns False if an older frame was dropped to make room.
+        """
+        dropped = self._frames.full()
+        if dropped:
+            self._frames.get_nowait()
+            self.dropped_frames += 1
+        self._frames.put_nowait(frame)
+        return not dropped
+
+    async def write_frames(self) -> None:
+        try:
+            while True:
+                frame = await self._frames.get()
+                self.writer.write(frame)
+                await self.writer.drain()
+        except ConnectionError:
+            logger.info("Lost connection to spectator %s", self.address)
+
 
 class BGServer:
     server: asyncio.Server
@@ -26,8 +116,20 @@ class BGServer:
         port: int,
         buffer_size=2048,
         timeout: float = 10,
+        grace_period: float = 60,
+        updates_log_size: int = 64,
+        max_spectators: int = 50,
+        host: str | None = None,
+        metrics_port: int | None = None,
+        metrics_log_interval: float | None = None,
+        on_update: Callable[[], None] = lambda: None,
     ) -> None:
-        self._ip = self.ip4_addresses()
+        """
+        on_update: called when the game or player2's connection changes, on the
+        thread that changed it.
+        """
+        self._ip = [host] if host is not None else self.ip4_addresses()
+        self._on_update = on_update
         self._stop_event = asyncio.Event()
         self._buffer_size = buffer_size
         self.online_backgammon = OnlineBackgammon(
@@ -39,6 +141,27 @@ class BGServer:
         self._game_started_event = asyncio.Event()
         self.server_thread: Thread | None = None
 
+        # player2's seat is kept for the session token during the grace period
+        self._grace_period = grace_period
+        self._session_token: str | None = None
+        self._session_expires: float = 0
+        self._updates_lock = RLock()
+        self._sequence = 0
+        self._recorded_version = -1
+        self._updates: deque[OnlineGameState] = deque(maxlen=updates_log_size)
+
+        self._max_spectators = max_spectators
+        self._spectators: set[Spectator] = set()
+        self._spectator_frame: tuple[int, bytes] = (-1, b"")
+        self._state_frame: tuple[int, bytes] = (-1, b"")
+
+        self.metrics = MetricsRegistry()
+        self._open_connections = 0
+        self._metrics_port = metrics_port
+        self._metrics_log_interval = metrics_log_interval
+
+        self._record_update()
+
     def ip4_addresses(self) -> list[str]:
         ip_list = []
         interfaces = psutil.net_if_addrs()
@@ -60,34 +183,213 @@ class BGServer:
         return self.online_backgammon.get_online_game_state()
 
     async def close_connection(self, writer: asyncio.StreamWriter, address: str):
-        print(f"Closing connection to {address}")
+        logger.info("Closing connection to %s", address)
         writer.close()
-        await writer.wait_closed()
+        try:
+            await writer.wait_closed()
+        except ConnectionError:
+            pass
+
+    def _record_update(self) -> None:
+        """
+        Logs player2's view of the game if it changed since the last recorded update.
+        """
+        with self._updates_lock:
+            version = self.online_backgammon.version
+            if version == self._recorded_version:
+                return
+            self._recorded_version = version
+            self._sequence += 1
+            state = self.online_backgammon.get_mirrored_state().model_copy(
+                update={"sequence": self._sequence}
+            )
+            self._updates.append(state)
+            self._on_update()
+
+            if self._spectators:
+                self.loop.call_soon_threadsafe(
+                    self._broadcast, self._get_spectator_frame()
+                )
+
+    def _get_spectator_frame(self) -> bytes:
+        """
+        Spectators watch from the host's side. The frame is encoded once per update
+        and the same bytes are written to every spectator.
+        """
+        sequence, frame = self._spectator_frame
+        if sequence != self._sequence:
+            state = self.local_get_game_state()
+            state.sequence = self._sequence
+            frame = encode_message(state)
+            self._spectator_frame = (self._sequence, frame)
+        return frame
+
+    def _broadcast(self, frame: bytes) -> None:
+        for spectator in self._spectators:
+            if not spectator.push(frame):
+                self.metrics.increment("spectator_dropped_frames_total")
+        self.metrics.increment(
+            "messages_out_total", len(self._spectators), labels={"type": "spectator"}
+        )
+        self.metrics.increment("bytes_out_total", len(frame) * len(self._spectators))
+
+    def _get_current_state(self) -> OnlineGameState:
+        self._record_update()
+        return self._updates[-1]
+
+    def _get_current_state_frame(self) -> bytes:
+        """
+        The encoded current state, shared by every response until the game changes.
+        """
+        with self._updates_lock:
+            state = self._get_current_state()
+            sequence, frame = self._state_frame
+            if sequence != state.sequence:
+                frame = encode_message(state)
+                self._state_frame = (state.sequence, frame)
+            return frame
+
+    def _get_missed_updates(self, last_sequence: int) -> list[OnlineGameState]:
+        """
+        Returns the updates after last_sequence, or only the current state if some of
+        them are no longer in the log.
+        """
+        self._record_update()
+        updates = list(self._updates)
+        if last_sequence < updates[0].sequence - 1:
+            return updates[-1:]
+        return [update for update in updates if update.sequence > last_sequence]
+
+    def _open_session(self, token: str | None) -> bool:
+        """
+        Returns whether the client can take player2's seat. The seat is reserved for
+        the last session until its grace period ends.
+        """
+        if self.connected:
+            return False
+
+        if (
+            self._session_token is not None
+            and token != self._session_token
+            and time.time() < self._session_expires
+        ):
+            return False
+
+        if token is None or token != self._session_token:
+            self._session_token = secrets.token_urlsafe(16)
+
+        return True
+
+    def _close_session(self, left: bool) -> None:
+        self.connected = False
+        self.online_backgammon.is_player2_connected = False
+        self._on_update()
+        self.metrics.set_gauge("active_games", 0)
+        if left:
+            self._session_token = None
+        else:
+            self._session_expires = time.time() + self._grace_period
+
+    @property
+    def reconnect_pending(self) -> bool:
+        return (
+            not self.connected
+            and self._session_token is not None
+            and time.time() < self._session_expires
+        )
 
     async def handle_client(
         self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
     ):
         address = writer.get_extra_info(name="peername")
-        print(f"{address} connected to the server")
+        logger.info("%s connected to the server", address)
+        self.metrics.increment("connections_total")
+        self._open_connections += 1
+        self.metrics.set_gauge("open_connections", self._open_connections)
+        try:
+            await self._handle_connection(reader=reader, writer=writer, address=address)
+        finally:
+            self._open_connections -= 1
+            self.metrics.set_gauge("open_connections", self._open_connections)
 
-        if self.connected:
-            print(f"{address} joined to an active game")
+    async def _handle_connection(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        address: str,
+    ):
+        try:
+            session = await asyncio.wait_for(
+                receive_message(reader), timeout=self._timeout
+            )
+        except Exception as ex:
+            logger.warning("%s did not open a session: %r", address, ex)
+            self.metrics.increment(
+                "connections_rejected_total", labels={"reason": "no session"}
+            )
+            await self.close_connection(writer=writer, address=address)
+            return
+
+        if type(session) is SessionRequest and session.spectator:
+            await self.handle_spectator(reader=reader, writer=writer, address=address)
+            return
+
+        if type(session) is not SessionRequest or not self._open_session(
+            session.token
+        ):
+            logger.info("%s joined to an active game", address)
+            self.metrics.increment(
+                "connections_rejected_total", labels={"reason": "game full"}
+            )
             await self.close_connection(writer=writer, address=address)
             return
 
         self._game_started_event.set()
         self.connected = True
+        self.online_backgammon.is_player2_connected = True
+        self.metrics.set_gauge("active_games", 1)
+        self._on_update()
+        left = False
+
+        updates = self._get_missed_updates(session.last_sequence)
+        logger.info("%s opened a session, sending %d updates", address, len(updates))
+        try:
+            await self.send_data(
+                writer=writer,
+                data=SessionResponse(token=self._session_token, updates=updates),
+            )
+        except ConnectionError:
+            logger.info("Lost connection to %s while opening a session", address)
+            self._close_session(left=False)
+            await self.close_connection(writer=writer, address=address)
+            return
 
         while not self._stop_event.is_set():
             try:
-                raw_data = await asyncio.wait_for(
-                    reader.read(self._buffer_size), timeout=self._timeout
+                frame = await asyncio.wait_for(
+                    receive_frame(reader), timeout=self._timeout
                 )
-                if not raw_data:
-                    print(f"Received no data from {address}")
-                    break
-                request = pickle.loads(raw_data)
-                print(f"Received data from {address}: {request}")
+                request = pickle.loads(frame)
+            except (asyncio.IncompleteReadError, ConnectionError):
+                logger.info("Received no data from %s", address)
+                break
+            except (pickle.UnpicklingError, EOFError, ValueError) as ex:
+                logger.warning("Received a malformed message from %s: %r", address, ex)
+                self.metrics.increment("malformed_messages_total")
+                break
+            except TimeoutError:
+                logger.warning("Lost connection to %s: waiting for connection", address)
+                break
+            except asyncio.CancelledError:
+                logger.info("Connection to %s cancelled", address)
+                break
+
+            request_type = get_message_type(request)
+            logger.debug("Received data from %s: %s", address, request)
+            self.metrics.increment("messages_in_total", labels={"type": request_type})
+            self.metrics.increment("bytes_in_total", HEADER.size + len(frame))
+
+            with Timer(self.metrics, "handler_latency_seconds", {"type": request_type}):
                 if request == ServerFlags.get_current_state:
                     pass
                 elif request == ServerFlags.undo:
@@ -95,10 +397,8 @@ class BGServer:
                 elif request == ServerFlags.done:
                     self.done_turn()
                 elif request == ServerFlags.leave:
-                    print(f"Player2 ({address}) left the game.")
-
-                    self.connected = False
-                    self.online_backgammon.is_player2_connected = False
+                    logger.info("Player2 (%s) left the game.", address)
+                    left = True
                     break
                 elif type(request) is Move:
                     manipulated_move: Move = request
@@ -107,33 +407,94 @@ class BGServer:
                 elif type(request) is Color:
                     self.online_backgammon.online_color = request
 
-                response = self.online_backgammon.manipulate_board()
-                await self.send_data(writer=writer, data=response)
-                print(f"Data sent back to: {address}: {type(response)}")
-
-            except TimeoutError:
-                print(f"Lost connection to {address}: waiting for connection")
-                self.connected = False
-                break
-            except asyncio.CancelledError:
-                self.connected = False
-                print(f"Connection to {address} cancelled")
-                break
+                try:
+                    await self.send_frame(
+                        writer=writer,
+                        frame=self._get_current_state_frame(),
+                        message_type=OnlineGameState.__name__,
+                    )
+                except ConnectionError:
+                    logger.info("Lost connection to %s while sending", address)
+                    break
+                logger.debug("State sent back to: %s", address)
 
+        self._close_session(left=left)
         await self.close_connection(writer=writer, address=address)
 
+    async def handle_spectator(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        address: str,
+    ):
+        if len(self._spectators) >= self._max_spectators:
+            logger.warning("Spectator %s rejected, too many spectators", address)
+            self.metrics.increment(
+                "connections_rejected_total", labels={"reason": "too many spectators"}
+            )
+            await self.close_connection(writer=writer, address=address)
+            return
+
+        spectator = Spectator(writer=writer, address=address)
+        with self._updates_lock:
+            spectator.push(self._get_spectator_frame())
+        self._spectators.add(spectator)
+        self.metrics.set_gauge("spectators", len(self._spectators))
+        writer_task = asyncio.create_task(spectator.write_frames())
+        logger.info("%s is spectating (%d spectators)", address, len(self._spectators))
+
+        # spectators are read-only, anything but leave and keepalives is ignored
+        try:
+            while not self._stop_event.is_set():
+                frame = await asyncio.wait_for(
+                    receive_frame(reader), timeout=self._timeout
+                )
+                if pickle.loads(frame) == ServerFlags.leave:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        except TimeoutError:
+            logger.warning("Spectator %s sent no keepalive", address)
+        except (pickle.UnpicklingError, EOFError, ValueError) as ex:
+            logger.warning("Received a malformed message from %s: %r", address, ex)
+            self.metrics.increment("malformed_messages_total")
+        except asyncio.CancelledError:
+            logger.info("Connection to %s cancelled", address)
+        finally:
+            self._spectators.discard(spectator)
+            self.metrics.set_gauge("spectators", len(self._spectators))
+            writer_task.cancel()
+            await asyncio.gather(writer_task, return_exceptions=True)
+            logger.info(
+                "Spectator %s left, dropped %d frames",
+                address,
+                spectator.dropped_frames,
+            )
+            await self.close_connection(writer=writer, address=address)
+
     async def send_data(self, writer: asyncio.StreamWriter, data):
-        writer.write(pickle.dumps(data))
+        await self.send_frame(
+            writer=writer,
+            frame=encode_message(data),
+            message_type=get_message_type(data),
+        )
+
+    async def send_frame(
+        self, writer: asyncio.StreamWriter, frame: bytes, message_type: str
+    ):
+        writer.write(frame)
         await writer.drain()
+        self.metrics.increment("messages_out_total", labels={"type": message_type})
+        self.metrics.increment("bytes_out_total", len(frame))
 
     def run_server(self):
         if self.server_thread is not None:
-            print("Server already running.")
+            logger.warning("Server already running.")
             return
 
         if self._stop_event.is_set():
             self._stop_event = asyncio.Event()
-            print("Starting again.")
+            logger.info("Starting again.")
 
         async def start_server():
             self.server = await asyncio.start_server(
@@ -145,13 +506,31 @@ class BGServer:
             addresses = ", ".join(
                 str(sock.getsockname()) for sock in self.server.sockets
             )
-            print(f"Serving on {addresses}")
+            logger.info("Serving on %s", addresses)
+
+            if self._metrics_port is not None:
+                metrics_server = await serve_metrics(
+                    metrics=self.metrics, host="127.0.0.1", port=self._metrics_port
+                )
+            if self._metrics_log_interval is not None:
+                asyncio.create_task(
+                    log_metrics(metrics=self.metrics, interval=self._metrics_log_interval)
+                )
 
             async with self.server:
                 try:
                     await self.server.serve_forever()
                 except asyncio.CancelledError:
-                    print("Server stopped.")
+                    logger.info("Server stopped.")
+
+            if self._metrics_port is not None:
+                metrics_server.close()
+
+            # let the open connections close cleanly before the loop stops
+            connections = asyncio.all_tasks() - {asyncio.current_task()}
+            for connection in connections:
+                connection.cancel()
+            await asyncio.gather(*connections, return_exceptions=True)
 
         @run_threaded(daemon=True)
         def start():
@@ -162,10 +541,12 @@ class BGServer:
         self.server_thread = start()
 
     def stop_server(self):
-        print("Server shutting down")
+        logger.info("Server shutting down")
         self._stop_event.set()
 
         async def close_server():
+            for spectator in list(self._spectators):
+                spectator.writer.close()
             if self.server:
                 self.server.close()
                 await self.server.wait_closed()
@@ -177,16 +558,23 @@ class BGServer:
             self.server_thread.join()
             self.server_thread = None
 
+    @property
+    def spectators(self) -> int:
+        return len(self._spectators)
+
     @property
     def game_started(self) -> bool:
         return self._game_started_event.is_set()
 
     def set_local_color(self, local_color: Color) -> None:
         self.online_backgammon.local_color = local_color
+        self._record_update()
 
     def move_piece(self, move: Move) -> OnlineGameState:
         backgammon = self._get_game()
-        backgammon.handle_move(move=move)
+        with Timer(self.metrics, "move_validation_seconds"):
+            backgammon.handle_move(move=move)
+        self._record_update()
         return self.local_get_game_state()
 
     def done_turn(self) -> OnlineGameState:
@@ -199,11 +587,13 @@ class BGServer:
         else:
             backgammon.switch_turn()
 
+        self._record_update()
         return self.local_get_game_state()
 
     def undo_move(self) -> OnlineGameState:
         backgammon = self._get_game()
         backgammon.undo()
+        self._record_update()
         return self.local_get_game_state()
 
     def is_alive(self) -> bool:
@@ -211,93 +601,210 @@ class BGServer:
 
 
 class NetworkClient:
+    RECONNECT_BASE_DELAY = 0.5
+    RECONNECT_MAX_DELAY = 5
+
     def __init__(
         self,
         host_ip: str,
         port: int,
         buffer_size=2048,
         timeout: float = 10,
+        reconnect_timeout: float = 60,
+        on_session_update: Callable[[OnlineGameState], None] = lambda x: None,
     ) -> None:
         self.host = host_ip
         self.port = port
         self._buffer_size = buffer_size
         self._timeout = timeout
+        self._reconnect_timeout = reconnect_timeout
+        self._on_session_update = on_session_update
         self._timed_out_event = asyncio.Event()
         self._started_event = asyncio.Event()
         self._stop_event = asyncio.Event()
         self.request_queue: Queue[tuple[Any, Callable[[Any], None]]] = Queue()
         self.time_on_receive = 0
         self.client_thread = None
+        self._session_token: str | None = None
+        self._last_sequence = -1
+        self._reconnecting = False
 
-    async def handle_connection(self):
+    async def open_session(
+        self,
+    ) -> tuple[asyncio.StreamReader, asyncio.StreamWriter] | None:
+        """
+        Connects to the server and resumes the session if there is one.
+        Updates missed while disconnected are passed to on_session_update.
+        """
         try:
             reader, writer = await asyncio.wait_for(
-                fut=asyncio.open_connection(host=self.host, port=self.port),
+                fut=asyncio.open_connection(
+                    host=self.host, port=self.port, limit=self._buffer_size
+                ),
                 timeout=self._timeout,
             )
-            self._started_event.set()
-            print(f"Connected to {self.host}")
+            await self.handle_send_data(
+                data=SessionRequest(
+                    token=self._session_token, last_sequence=self._last_sequence
+                ),
+                writer=writer,
+            )
+            response = await asyncio.wait_for(
+                receive_message(reader), timeout=self._timeout
+            )
         except ConnectionRefusedError:
-            print(f"{self.host} refused to connect")
-            self._stop_event.set()
-            return
+            logger.warning("%s refused to connect", self.host)
+            return None
         except:
-            print(f"Could not establish connection to {self.host}")
+            logger.warning("Could not establish connection to %s", self.host)
+            return None
+
+        self._session_token = response.token
+        for update in response.updates:
+            self._last_sequence = update.sequence
+            self._on_session_update(update)
+        self.time_on_receive = time.time()
+        logger.info(
+            "Connected to %s, received %d updates", self.host, len(response.updates)
+        )
+        return reader, writer
+
+    async def reconnect(
+        self,
+    ) -> tuple[asyncio.StreamReader, asyncio.StreamWriter] | None:
+        """
+        Tries to resume the session with exponential backoff until reconnect_timeout passes.
+        """
+        self._reconnecting = True
+        self._drop_requests()
+        deadline = time.time() + self._reconnect_timeout
+        delay = self.RECONNECT_BASE_DELAY
+        connection = None
+
+        while connection is None and time.time() < deadline:
+            retry_time = time.time() + delay * random.uniform(1, 1.5)
+            logger.info(
+                "Reconnecting to %s in %.1fs", self.host, retry_time - time.time()
+            )
+            while time.time() < retry_time:
+                if self._stop_event.is_set():
+                    self._reconnecting = False
+                    return None
+                await asyncio.sleep(0.1)
+
+            connection = await self.open_session()
+            delay = min(delay * 2, self.RECONNECT_MAX_DELAY)
+
+        self._reconnecting = False
+        return connection
+
+    def _drop_requests(self):
+        """
+        Requests queued before the connection was lost are stale once the session is resumed.
+        """
+        while True:
+            try:
+                self.request_queue.get_nowait()
+            except EmptyQueueError:
+                return
+            self.request_queue.task_done()
+
+    async def handle_connection(self):
+        connection = await self.open_session()
+        if connection is None:
             self._stop_event.set()
             return
-        # loop to send messages
+        self._started_event.set()
+
+        while connection is not None:
+            reader, writer = connection
+            # loop to send messages
+            await self.handle_requests(reader=reader, writer=writer)
+
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+            logger.debug("closed writer")
+
+            if self._stop_event.is_set():
+                return
+
+            connection = await self.reconnect()
+
+        logger.warning("Could not reconnect to %s", self.host)
+        self.disconnect(threaded=True)
 
+    async def handle_requests(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ):
+        """
+        Sends queued requests until the client is stopped or the connection is lost.
+        """
         while not self._stop_event.is_set():
             try:
                 data, on_receive = self.request_queue.get(timeout=1)
-                await self.handle_send_data(data=data, writer=writer)
-                self.request_queue.task_done()
-                await self.handle_received_data(on_receive=on_receive, reader=reader)
             except EmptyQueueError:
-                print("Empty queue...")
+                logger.debug("Empty queue...")
                 continue
 
-        writer.close()
-        await writer.wait_closed()
-        print("closed writer")
+            try:
+                await self.handle_send_data(data=data, writer=writer)
+            except ConnectionError:
+                logger.warning("Connection lost while sending")
+                return
+            finally:
+                self.request_queue.task_done()
+
+            if not await self.handle_received_data(
+                on_receive=on_receive, reader=reader
+            ):
+                return
 
     async def handle_send_data(self, data, writer: asyncio.StreamWriter):
-        writer.write(pickle.dumps(data))
-        await writer.drain()
-        # print(f"Data sent: {data}")
+        await send_message(writer=writer, data=data)
 
     async def handle_received_data(
         self, on_receive: Callable[[Any], None], reader: asyncio.StreamReader
-    ):
+    ) -> bool:
+        """
+        Returns False if the connection was lost.
+        """
         try:
-            raw_data = await asyncio.wait_for(
-                reader.read(self._buffer_size), timeout=self._timeout
+            data = await asyncio.wait_for(
+                receive_message(reader), timeout=self._timeout
             )
-            if not raw_data:
-                self.disconnect(threaded=True)
-                print("Received no data, closing client")
-                return
-            # print("Data received.")
-            data = pickle.loads(raw_data)
-            on_receive(data)
-            self.time_on_receive = time.time()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            logger.warning("Received no data, reconnecting")
+            return False
         except TimeoutError:
-            self.disconnect(threaded=True)
-            print("Timed out... Closing client")
+            logger.warning("Timed out... reconnecting")
+            return False
         except Exception as ex:
-            self.disconnect(threaded=True)
-            print(f"Un handled exception: {ex}")
+            logger.exception("Un handled exception: %r", ex)
+            return False
+
+        if isinstance(data, OnlineGameState):
+            self._last_sequence = data.sequence
+        on_receive(data)
+        self.time_on_receive = time.time()
+        return True
 
     def send(self, data, on_receive: Callable[[Any], None] = lambda x: None):
-        if not self._started_event.is_set() or self._stop_event.is_set():
-            print("Not connected, cannot send")
+        if (
+            not self._started_event.is_set()
+            or self._stop_event.is_set()
+            or self._reconnecting
+        ):
+            logger.debug("Not connected, cannot send")
             return
         request = (data, on_receive)
         self.request_queue.put(request)
 
     def connect(self):
         if self.client_thread:
-            print(f"Already connected to {self.host}.")
+            logger.warning("Already connected to %s.", self.host)
 
         self.request_queue = Queue()
         self._started_event = asyncio.Event()
@@ -306,22 +813,22 @@ class NetworkClient:
         @run_threaded(daemon=True)
         def connect_threaded():
             asyncio.run(self.handle_connection())
-            print("Client disconnected")
+            logger.info("Client disconnected")
 
         self.client_thread = connect_threaded()
 
     def disconnect(self, data=None, threaded=False):
         if not self.client_thread:
-            print("Cannot disconnect. Client not connected")
+            logger.warning("Cannot disconnect. Client not connected")
             return
 
-        if data is not None:
+        if data is not None and not self._reconnecting:
             self.send(data=data)
             self.request_queue.join()
         self._stop_event.set()
         if not threaded:
             self.client_thread.join()
-        print(f"Disconnected from: {self.host}")
+        logger.info("Disconnected from: %s", self.host)
         self.client_thread = None
 
     @property
@@ -332,6 +839,102 @@ class NetworkClient:
     def started(self):
         return self._started_event.is_set()
 
+    @property
+    def reconnecting(self):
+        return self._reconnecting
+
     @property
     def time_from_last_receive(self):
         return time.time() - self.time_on_receive
+
+
+class SpectatorClient:
+    """
+    Watches a game without playing. Every state update pushed by the server is passed to on_update.
+    """
+
+    def __init__(
+        self,
+        host_ip: str,
+        port: int,
+        buffer_size=2048,
+        timeout: float = 10,
+        on_update: Callable[[OnlineGameState], None] = lambda x: None,
+    ) -> None:
+        self.host = host_ip
+        self.port = port
+        self._buffer_size = buffer_size
+        self._timeout = timeout
+        self.on_update = on_update
+        self._started_event = asyncio.Event()
+        self.client_thread: Thread | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._writer: asyncio.StreamWriter | None = None
+
+    async def handle_connection(self):
+        try:
+            reader, writer = await asyncio.wait_for(
+                fut=asyncio.open_connection(
+                    host=self.host, port=self.port, limit=self._buffer_size
+                ),
+                timeout=self._timeout,
+            )
+            await send_message(writer=writer, data=SessionRequest(spectator=True))
+        except:
+            logger.warning("Could not establish connection to %s", self.host)
+            return
+
+        self._loop = asyncio.get_running_loop()
+        self._writer = writer
+        self._started_event.set()
+        logger.info("Spectating %s", self.host)
+        keepalive_task = asyncio.create_task(send_keepalives(writer))
+
+        while True:
+            try:
+                state = await receive_message(reader)
+            except (asyncio.IncompleteReadError, ConnectionError):
+                break
+            self.on_update(state)
+
+        keepalive_task.cancel()
+        await asyncio.gather(keepalive_task, return_exceptions=True)
+
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except ConnectionError:
+            pass
+        self.client_thread = None
+        logger.info("Stopped spectating %s", self.host)
+
+    def connect(self):
+        if self.client_thread:
+            logger.warning("Already spectating %s.", self.host)
+            return
+
+        self._started_event = asyncio.Event()
+
+        @run_threaded(daemon=True)
+        def connect_threaded():
+            asyncio.run(self.handle_connection())
+
+        self.client_thread = connect_threaded()
+
+    def disconnect(self):
+        if not self.client_thread:
+            logger.warning("Cannot disconnect. Client not connected")
+            return
+
+        thread = self.client_thread
+        if self._loop is not None and self._writer is not None:
+            self._loop.call_soon_threadsafe(self._writer.close)
+        thread.join()
+
+    @property
+    def connected(self):
+        return bool(self.client_thread)
+
+    @property
+    def started(self):
+        return self._started_event.is_set()
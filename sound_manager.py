@@ -1,4 +1,6 @@
+import functools
 import pygame
+from asset_registry import AssetRegistry
 
 
 class SoundManager:
@@ -7,7 +9,14 @@ class SoundManager:
     _mute_volume: float 
         
     def __init__(self, sounds: dict[str, str]) -> None:
-        self.sounds = {key: pygame.mixer.Sound(sounds[key]) for key in sounds}
+        """
+        The sounds are loaded on first use. self.sounds holds the loaded ones.
+        """
+        self.sounds = {}
+        for key, path in sounds.items():
+            AssetRegistry.register(
+                f"sound {key}", functools.partial(pygame.mixer.Sound, path)
+            )
         self._volume = 1
         self._mute_volume = 1
     
@@ -19,7 +28,7 @@ class SoundManager:
         self._volume = self._mute_volume  
     
     def play(self, key: str):
-        self.sounds[key].play()
+        self.get_sound(key).play()
     
     @property
     def volume(self):
@@ -32,7 +41,12 @@ class SoundManager:
             sound.set_volume(volume) 
     
     def get_sound(self, key: str):
-        return self.sounds[key]
+        sound = self.sounds.get(key)
+        if sound is None:
+            sound = AssetRegistry.get(f"sound {key}")
+            sound.set_volume(self._volume)
+            self.sounds[key] = sound
+        return sound
     
     def stop_all(self, exclude: list[str] = []):
         for key in self.sounds:
@@ -0,0 +1,59 @@
+import builtins
+import importlib.util
+import threading
+import time
+from asset_registry import AssetRegistry
+
+
+class StartupProfiler:
+    """
+    Measures the start of the game: how long every module took to import, not counting
+    the modules it imported, how long every asset took to load and when the first
+    frame was shown. Only imports on the main thread are measured.
+    """
+
+    def __init__(self) -> None:
+        self.started_at = time.perf_counter()
+        self.imports: dict[str, float] = {}
+        self._children_times: list[float] = []
+        self._import = builtins.__import__
+
+    def install(self) -> None:
+        builtins.__import__ = self._timed_import
+
+    def uninstall(self) -> None:
+        builtins.__import__ = self._import
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        if threading.current_thread() is not threading.main_thread():
+            return self._import(name, globals, locals, fromlist, level)
+
+        self._children_times.append(0)
+        start = time.perf_counter()
+        try:
+            return self._import(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = time.perf_counter() - start
+            children_time = self._children_times.pop()
+            if self._children_times:
+                self._children_times[-1] += elapsed
+            key = name
+            if level > 0 and globals is not None:
+                key = importlib.util.resolve_name(
+                    "." * level + name, globals.get("__package__")
+                )
+            self.imports[key] = self.imports.get(key, 0) + elapsed - children_time
+
+    def report(self, limit: int = 15) -> None:
+        self.uninstall()
+        print(f"first frame after:  {(time.perf_counter() - self.started_at) * 1000:.1f}ms")
+        print(f"imports:            {sum(self.imports.values()) * 1000:.1f}ms")
+        for name, seconds in sorted(
+            self.imports.items(), key=lambda item: item[1], reverse=True
+        )[:limit]:
+            print(f"  {name:<40}{seconds * 1000:8.1f}ms")
+        print(f"assets:             {sum(AssetRegistry.load_times.values()) * 1000:.1f}ms")
+        for name, seconds in sorted(
+            AssetRegistry.load_times.items(), key=lambda item: item[1], reverse=True
+        ):
+            print(f"  {name:<40}{seconds * 1000:8.1f}ms")
@@ -0,0 +1,76 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+import logging
+from threading import Lock
+import time
+from typing import Callable
+import config
+from metrics import MetricsRegistry
+
+logger = logging.getLogger(__name__)
+
+
+class WorkerPool:
+    """
+    A bounded pool of named threads shared by short background jobs, like bot searches.
+    Long-lived loops, like the servers and clients, keep their own threads.
+    The pool is created on the first job and GameManager.quit waits for it to finish.
+    """
+
+    THREAD_NAME_PREFIX = "worker"
+
+    metrics = MetricsRegistry()
+    _executor: ThreadPoolExecutor | None = None
+    _lock = Lock()
+    _queued = 0
+
+    @classmethod
+    def submit[T](cls, func: Callable[..., T], *args, **kwargs) -> Future[T]:
+        queued_at = time.perf_counter()
+
+        def run() -> T:
+            cls._update_queued(-1)
+            cls.metrics.observe("worker_wait_seconds", time.perf_counter() - queued_at)
+            started_at = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                cls.metrics.observe(
+                    "worker_run_seconds", time.perf_counter() - started_at
+                )
+
+        cls._update_queued(1)
+        cls.metrics.increment("worker_jobs_total")
+        with cls._lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(
+                    max_workers=config.WORKER_THREADS,
+                    thread_name_prefix=cls.THREAD_NAME_PREFIX,
+                )
+            future = cls._executor.submit(run)
+        future.add_done_callback(cls._on_done)
+        return future
+
+    @classmethod
+    def _update_queued(cls, change: int) -> None:
+        with cls._lock:
+            cls._queued += change
+            cls.metrics.set_gauge("worker_queue_depth", cls._queued)
+
+    @classmethod
+    def _on_done(cls, future: Future) -> None:
+        if future.cancelled():
+            # jobs dropped by shutdown never ran, so they are still counted as queued
+            cls._update_queued(-1)
+        elif future.exception() is not None:
+            logger.error("Worker job failed", exc_info=future.exception())
+
+    @classmethod
+    def shutdown(cls, wait=True) -> None:
+        """
+        Drops the queued jobs and, if wait is set, waits for the running ones.
+        """
+        with cls._lock:
+            executor = cls._executor
+            cls._executor = None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)